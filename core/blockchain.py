@@ -4,13 +4,19 @@ It defines the Blockchain class which manages the chain of blocks and transactio
 """
 
 import hashlib
-import json
+import logging
+import threading
+from collections import deque
+import orjson
 import time as timestamp  # Rename the import to avoid conflict
-from datetime import datetime
 from utilities.convert_to_ethereum_address import generate_ethereum_address, validate_ethereum_address
 from .consensus import Consensus
 import os
-from utils.hashing_util import hash_block  # Update the import path
+from utils.hashing_util import hash_block, encode_transaction, new_transactions_hasher, update_transactions_hash, transactions_digest
+from utils.timeconv import convert_to_seconds
+from utils.config_util import load_config
+
+logger = logging.getLogger(__name__)
 
 
 class Blockchain:
@@ -18,39 +24,52 @@ class Blockchain:
         self.config = config
         self.current_index = 0
         self.chain = []
+        # Per-block JSON for the chain it was encoded from, see
+        # iter_chain_json
+        self._block_json = []
+        self._block_json_chain = None
+        self._block_json_lock = threading.Lock()
         self.members = []
+        self._reset_member_indexes()
 
         if existing_chain:
+            # Blocks are linked through their stored hashes, so every
+            # block must carry one
+            if any('hash' not in block for block in existing_chain):
+                raise ValueError("Existing chain contains a block without a hash")
+
             # Use existing chain if provided
             self.chain = existing_chain
             self.current_index = len(self.chain)
-            print(f"Initialized blockchain with existing chain. Length: {
-                  self.current_index}")
+            logger.info("Initialized blockchain with existing chain. Length: %d",
+                        self.current_index)
         else:
             # Create genesis block only if no existing chain
             self.create_genesis_block()
 
-        self.pending_transactions = []
+        self.pending_transactions = deque()
+        # Running hash over pending_transactions, finalized in create_block
+        self._pending_hasher = new_transactions_hasher()
+        # Held while the pool and its running hash change together, since
+        # request threads add transactions while the block thread drains
+        self._pool_lock = threading.Lock()
+        # Set whenever a transaction is pooled, to wake the block thread
+        self.transaction_event = threading.Event()
 
         # Convert block interval to seconds
         interval_value = config['blockchain']['block_creation']['interval']['value']
         interval_unit = config['blockchain']['block_creation']['interval']['unit']
-        self.block_interval = self.convert_to_seconds(
+        self.block_interval = convert_to_seconds(
             interval_value, interval_unit)
 
-        self.last_block_time = 0
+        # Monotonic time before which create_block holds transactions back;
+        # the first block after startup may be made straight away
+        self._next_block_deadline = 0
+        # Set once the wait for the next block has been logged, so it is
+        # reported once per block rather than on every poll
+        self._waiting_logged = False
         self.max_transactions = config['blockchain']['max_transactions_per_block']
 
-    def convert_to_seconds(self, value, unit):
-        """Convert time units to seconds"""
-        units = {
-            'seconds': 1,
-            'minutes': 60,
-            'hours': 3600,
-            'days': 86400
-        }
-        return value * units.get(unit.lower(), 1)
-
     def initialize(self):
         """Initialize blockchain after config is set"""
         if not self.config:
@@ -68,10 +87,9 @@ class Blockchain:
         try:
             config_path = os.path.join(
                 'use_case', 'config', 'timing_config.json')
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            return load_config(config_path)
         except Exception as e:
-            print(f"Error loading config: {str(e)}")
+            logger.error("Error loading config: %s", e)
             # Default configuration
             return {
                 "voting": {
@@ -88,17 +106,19 @@ class Blockchain:
 
     def new_block(self, previous_hash=None):
         """Create a new block in the blockchain"""
+        chain = self.chain
         block = {
-            'index': len(self.chain) + 1,
+            'index': len(chain) + 1,
             'timestamp': timestamp.time(),
             'transactions': self.current_transactions,
-            'previous_hash': previous_hash or self.hash(self.chain[-1])
+            'previous_hash': previous_hash or chain[-1]['hash']
         }
+        block['hash'] = hash_block(block)
 
         # Reset the current list of transactions
         self.current_transactions = []
 
-        self.chain.append(block)
+        chain.append(block)
         return block
 
     def new_transaction(self, sender, recipient, data):
@@ -107,7 +127,7 @@ class Blockchain:
             'sender': sender,
             'recipient': recipient,
             'data': data,
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': timestamp.time_ns()
         }
 
         # Create block proposal for transaction
@@ -132,12 +152,11 @@ class Blockchain:
     @staticmethod
     def hash(block):
         """
-        Creates a SHA-256 hash of a Block
+        Creates a hash of a Block
         :param block: <dict> Block
         :return: <str>
         """
-        block_string = json.dumps(block, sort_keys=True).encode()
-        return hashlib.sha256(block_string).hexdigest()
+        return hash_block(block)
 
     @property
     def last_block(self):
@@ -155,7 +174,7 @@ class Blockchain:
             self.chain,
             self.pending_transactions,
             block_data,
-            self.members
+            self.get_voters()
         )
         return block
 
@@ -166,13 +185,16 @@ class Blockchain:
         block, approved = self.consensus.vote_for_block(
             block_index,
             voter_address,
-            self.members
+            self.get_voters()
         )
 
         if approved:
             block['hash'] = self.hash(block)
             self.chain.append(block)
-            self.pending_transactions = []
+            with self._pool_lock:
+                self.pending_transactions.clear()
+                self._pending_hasher = new_transactions_hasher()
+            self.consensus.remove_block(block)
             self.consensus.reset_votes()
 
         return block
@@ -181,35 +203,137 @@ class Blockchain:
         """Add a new member to the blockchain"""
         # Add timestamp as Unix timestamp (integer) and generate Ethereum address
         member['address'] = generate_ethereum_address()
-        member['timestamp'] = int(datetime.utcnow().timestamp())
+        member['timestamp'] = timestamp.time_ns() // 1_000_000_000
 
-        self.members.append(member)
+        self.register_member(member)
         return member
 
+    def _reset_member_indexes(self):
+        """Drop all secondary indexes over self.members"""
+        self._member_index = {}  # address -> position in self.members
+        self._member_status = {}  # address -> status bucket it is filed under
+        self._by_status = {'active': {}, 'pending': {}, 'rejected': {}}
+        self._lenders = set()  # Addresses of active lenders
+        self._voters = None  # Cached frozenset of self._lenders
+        self._members_json = None  # Cached (body, etag) of self.members
+
+    def _index_status(self, member):
+        """File a member under its current status, leaving its old bucket"""
+        address = member['address']
+        old_status = self._member_status.get(address)
+        if old_status is not None:
+            self._by_status[old_status].pop(address, None)
+
+        self._members_json = None
+
+        status = member['status']
+        self._member_status[address] = status
+        self._by_status.setdefault(status, {})[address] = member
+
+        # Track active lenders as they change, so voter lookups and counts
+        # never rescan the active members
+        if status == 'active' and member.get('role') == 'lender':
+            if address not in self._lenders:
+                self._lenders.add(address)
+                self._voters = None
+        elif address in self._lenders:
+            self._lenders.discard(address)
+            self._voters = None
+
+    def register_member(self, member):
+        """Append a member record as-is and index it by address"""
+        self._member_index[member['address']] = len(self.members)
+        self.members.append(member)
+        self._index_status(member)
+
+    def set_members(self, members):
+        """Replace all members, e.g. after syncing from the main node"""
+        self.members = members
+        self._reset_member_indexes()
+        for i, member in enumerate(members):
+            self._member_index[member['address']] = i
+            self._index_status(member)
+
+    def get_member(self, address):
+        """Get a member by address, or None if unknown"""
+        i = self._member_index.get(address)
+        return None if i is None else self.members[i]
+
     def update_member(self, member):
         """Update an existing member's data"""
-        for i, m in enumerate(self.members):
-            if m['address'] == member['address']:
-                # Ensure timestamp remains as Unix timestamp if not provided
-                if 'timestamp' not in member:
-                    member['timestamp'] = self.members[i]['timestamp']
-                self.members[i] = member
-                return
-        raise ValueError(f"Member not found with address: {member['address']}")
-
-    def get_members(self):
-        """Get all members grouped by status"""
-        active = []
-        pending = []
-        rejected = []
-
-        for member in self.members:
-            if member['status'] == 'active':
-                active.append(member)
-            elif member['status'] == 'pending':
-                pending.append(member)
-            elif member['status'] == 'rejected':
-                rejected.append(member)
+        i = self._member_index.get(member['address'])
+        if i is None:
+            raise ValueError(f"Member not found with address: {member['address']}")
+
+        # Ensure timestamp remains as Unix timestamp if not provided
+        if 'timestamp' not in member:
+            member['timestamp'] = self.members[i]['timestamp']
+        self.members[i] = member
+        self._index_status(member)
+
+    def get_voters(self):
+        """Addresses allowed to vote on blocks (active lenders)"""
+        if self._voters is None:
+            self._voters = frozenset(self._lenders)
+        return self._voters
+
+    def iter_chain_json(self, batch_size=256):
+        """Chain and its length as an iterator of JSON chunks plus an ETag.
+
+        Blocks are not modified once appended, so each is encoded only
+        once and new blocks are encoded as the chain grows. The tip hash
+        covers every earlier block, so it and the length make the ETag.
+        """
+        with self._block_json_lock:
+            chain = self.chain
+            if self._block_json_chain is not chain:
+                self._block_json = []
+                self._block_json_chain = chain
+            encoded = self._block_json
+            encoded.extend(orjson.dumps(block) for block in chain[len(encoded):])
+            length = len(encoded)
+
+        # Both the ETag and the body describe the first length blocks
+        # only; the chain and the cache may grow while this is streamed
+        etag = f"{length}-{chain[length - 1]['hash']}" if length else '0'
+
+        def chunks():
+            yield b'{"chain":['
+            for start in range(0, length, batch_size):
+                if start:
+                    yield b','
+                yield b','.join(encoded[start:min(start + batch_size, length)])
+            yield b'],"length":%d}' % length
+
+        return chunks(), etag
+
+    def get_members_json(self):
+        """Members list as JSON bytes plus an ETag, cached until a member
+        is registered or updated"""
+        if self._members_json is None:
+            body = orjson.dumps(self.members)
+            etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+            self._members_json = (body, etag)
+        return self._members_json
+
+    def get_active_lender_count(self):
+        """Number of active lenders"""
+        return len(self._lenders)
+
+    def get_members(self, status=None):
+        """Get all members grouped by status
+
+        With status, only that group is filled; the others stay empty so
+        the shape of the result does not change
+        """
+        def group(name):
+            if status and status != name:
+                return []
+            return list(self._by_status[name].values())
+
+        active = group('active')
+        pending = group('pending')
+        rejected = group('rejected')
 
         return {
             'active': active,
@@ -222,13 +346,21 @@ class Blockchain:
             }
         }
 
+    def get_member_counts(self):
+        """Number of members per status"""
+        return {status: len(bucket) for status, bucket in self._by_status.items()}
+
     def get_active_members(self):
         """Get only active members"""
-        return [m for m in self.members if m['status'] == 'active']
+        return list(self._by_status['active'].values())
 
     def get_pending_members(self):
         """Get only pending members"""
-        return [m for m in self.members if m['status'] == 'pending']
+        return list(self._by_status['pending'].values())
+
+    def get_members_by_status(self, status):
+        """Get members with the given status, read from the status index"""
+        return list(self._by_status.get(status, {}).values())
 
     def generate_address(self):
         """Generate a unique address for a member"""
@@ -238,99 +370,102 @@ class Blockchain:
     def clear_members(self):
         """Clear all members from the blockchain"""
         self.members = []
+        self._reset_member_indexes()
         return {"status": "success", "message": "All members cleared"}
 
     def add_transaction(self, transaction):
         """Add transaction to pending pool"""
-        self.pending_transactions.append({
+        # Encoded before taking the lock, so a payload that cannot be
+        # encoded fails here without holding up the pool
+        encoded = encode_transaction({
             'data': transaction,
-            'timestamp': int(timestamp.time())
+            'timestamp': timestamp.time_ns() // 1_000_000_000
         })
-        print(f"\nTransaction added to pool: {transaction}")
+        # Pool a snapshot decoded from the hashed bytes, so later edits to
+        # shared dicts (e.g. a member's status) can't drift from the digest
+        snapshot = orjson.loads(encoded)
+        with self._pool_lock:
+            update_transactions_hash(self._pending_hasher, encoded)
+            self.pending_transactions.append(snapshot)
+        self.transaction_event.set()
+        logger.debug("Transaction added to pool: %s", transaction)
 
     def create_genesis_block(self):
         """Create the first block in the chain"""
         genesis_block = {
             'index': 1,
-            'timestamp': int(timestamp.time()),
+            'timestamp': timestamp.time_ns() // 1_000_000_000,
             'transactions': [],
-            'previous_hash': '0',
-            'hash': hash_block({
-                'index': 1,
-                'timestamp': int(timestamp.time()),
-                'transactions': [],
-                'previous_hash': '0'
-            })
+            'transactions_hash': new_transactions_hasher().hexdigest(),
+            'previous_hash': '0'
         }
+        genesis_block['hash'] = hash_block(genesis_block)
         self.chain.append(genesis_block)
-        self.last_block_time = genesis_block['timestamp']
-        print(f"\nGenesis block created at {
-              genesis_block['timestamp']} with hash: {genesis_block['hash']}")
+        logger.info("Genesis block created at %s with hash: %s",
+                    genesis_block['timestamp'], genesis_block['hash'])
+
+    def _take_pending_transactions(self):
+        """Remove up to max_transactions from the pool for a new block and
+        return them with their transactions digest"""
+        with self._pool_lock:
+            pool = self.pending_transactions
+            if len(pool) <= self.max_transactions:
+                transactions = list(pool)
+                pool.clear()
+                transactions_hash = self._pending_hasher.hexdigest()
+                self._pending_hasher = new_transactions_hasher()
+            else:
+                transactions = [pool.popleft()
+                                for _ in range(self.max_transactions)]
+                transactions_hash = transactions_digest(transactions)
+                # Restart the running hash over what stays pooled
+                self._pending_hasher = new_transactions_hasher()
+                for transaction in pool:
+                    update_transactions_hash(self._pending_hasher,
+                                             encode_transaction(transaction))
+        return transactions, transactions_hash
 
     def create_block(self):
         """Create a new block with all pending transactions"""
         if not self.pending_transactions:
             return None
 
-        current_time = int(timestamp.time())
-        time_since_last = current_time - self.last_block_time
-
-        if time_since_last < self.block_interval:
-            # Only log when a block is created or when transactions are pending
-            if self.pending_transactions and not hasattr(self, '_last_log_time'):
-                self._last_log_time = current_time
-                print(f"\nWaiting for next block. {
-                      len(self.pending_transactions)} transaction(s) pending.")
-                print(f"Next block in {
-                      self.block_interval - time_since_last} seconds")
+        now = timestamp.monotonic()
+        if now < self._next_block_deadline:
+            if not self._waiting_logged:
+                self._waiting_logged = True
+                logger.info("Waiting for next block. %d transaction(s) pending. "
+                            "Next block in %d seconds",
+                            len(self.pending_transactions),
+                            self._next_block_deadline - now)
             return None
 
+        transactions, transactions_hash = self._take_pending_transactions()
+        current_time = timestamp.time_ns() // 1_000_000_000
+
         block = {
             'index': len(self.chain) + 1,
             'timestamp': current_time,
-            'transactions': self.pending_transactions.copy(),
+            'transactions': transactions,
+            'transactions_hash': transactions_hash,
             # Use the hash of the last block
             'previous_hash': self.chain[-1]['hash'],
             'hash': '',  # Placeholder for the hash
         }
 
-        # Calculate the hash for the new block
-        block['hash'] = hash_block(block)
+        # Calculate the hash for the new block, reusing the digest the
+        # pool built as the transactions arrived
+        block['hash'] = hash_block(block, transactions_hash)
 
-        self.pending_transactions = []  # Clear pool after creating block
-        self.last_block_time = current_time
-        if hasattr(self, '_last_log_time'):
-            delattr(self, '_last_log_time')
+        self._next_block_deadline = now + self.block_interval
+        self._waiting_logged = False
 
-        print(f"\nCreated block #{block['index']} with {
-              len(block['transactions'])} transaction(s) and hash: {block['hash']}")
+        logger.info("Created block #%d with %d transaction(s) and hash: %s",
+                    block['index'], len(block['transactions']), block['hash'])
         return block
 
     def add_block(self, block):
         """Add a block to the chain"""
         self.chain.append(block)
-        print(f"\nBlock #{block['index']} added to chain")
-        print(f"Total blocks: {len(self.chain)}")
-
-
-class Membership:
-    def __init__(self):
-        self.blockchain = Blockchain()
-        self.members = []
-
-    def add_member(self, name):
-        """
-        Manually add a member to the list of approved members.
-        :param name: <str> Name of the member
-        :return: <dict> Member object
-        """
-        public_key, private_key = self.generate_key_pair()
-        public_key_pem = self.serialize_public_key(public_key)
-        address = generate_ethereum_address(public_key_pem)
-        member = {'address': address, 'name': name}
-        self.members.append(member)
-        # Register the member in the blockchain
-        self.blockchain.register_member(address)
-        return member
-
-    # Other methods remain unchanged
+        logger.info("Block #%d added to chain. Total blocks: %d",
+                    block['index'], len(self.chain))
@@ -12,20 +12,22 @@ Key features:
 - Prevents double voting by tracking voter addresses
 """
 
-import hashlib
-import json
 from time import time
-from uuid import uuid4
+from utils.hashing_util import hash_block
+from utils.timeconv import convert_to_seconds
 
 
 class ProofOfVote:
     def __init__(self, config):
         self.config = config
         self.current_proposal = None
-        self.votes = {
-            'approve': [],
-            'reject': []
-        }
+        # Running tallies for the current proposal; the voter set is only
+        # kept to reject double votes
+        self.approve_count = 0
+        self.reject_count = 0
+        self.voters = set()
+        # Number of votes the current proposal needs, fixed when proposed
+        self.required_votes = None
         self.proposal_timestamp = None
 
         # Get config values directly from config
@@ -34,14 +36,14 @@ class ProofOfVote:
         # Convert timeout to seconds
         timeout_value = config['voting']['timeout']['value']
         timeout_unit = config['voting']['timeout']['unit']
-        self.vote_timeout = self.convert_to_seconds(
+        self.vote_timeout = convert_to_seconds(
             timeout_value, timeout_unit)
 
         # Convert auto-reject timeout to seconds
         if config['auto_reject']['enabled']:
             ar_timeout_value = config['auto_reject']['timeout']['value']
             ar_timeout_unit = config['auto_reject']['timeout']['unit']
-            self.auto_reject_timeout = self.convert_to_seconds(
+            self.auto_reject_timeout = convert_to_seconds(
                 ar_timeout_value, ar_timeout_unit)
         else:
             self.auto_reject_timeout = None
@@ -51,16 +53,6 @@ class ProofOfVote:
         print(f"Vote timeout: {self.vote_timeout} seconds")
         print(f"Auto-reject timeout: {self.auto_reject_timeout} seconds")
 
-    def convert_to_seconds(self, value, unit):
-        """Convert time units to seconds"""
-        units = {
-            'seconds': 1,
-            'minutes': 60,
-            'hours': 3600,
-            'days': 86400
-        }
-        return value * units.get(unit.lower(), 1)
-
     def check_timeout(self):
         """Check if voting has timed out"""
         if not self.proposal_timestamp:
@@ -83,15 +75,16 @@ class ProofOfVote:
 
     def check_consensus(self):
         """Check if consensus has been reached"""
-        active_lenders = self.get_active_lenders()
-        required_votes = len(active_lenders)
-        total_votes = len(self.votes['approve']) + len(self.votes['reject'])
+        required_votes = self.required_votes
+        if required_votes is None:
+            required_votes = len(self.get_active_lenders() or ())
+        total_votes = self.approve_count + self.reject_count
 
         print(f"\nChecking consensus:")
         print(f"Required votes: {required_votes}")
         print(f"Total votes: {total_votes}")
-        print(f"Approve votes: {len(self.votes['approve'])}")
-        print(f"Reject votes: {len(self.votes['reject'])}")
+        print(f"Approve votes: {self.approve_count}")
+        print(f"Reject votes: {self.reject_count}")
 
         # Check timeouts
         timeout_status = self.check_timeout()
@@ -101,8 +94,7 @@ class ProofOfVote:
                 return False
             elif timeout_status == 'vote_timeout':
                 if total_votes > 0:
-                    approve_percentage = len(
-                        self.votes['approve']) / total_votes
+                    approve_percentage = self.approve_count / total_votes
                     print(f"Voting timed out. Deciding based on {
                           total_votes} votes cast")
                     print(f"Approve percentage: {approve_percentage}")
@@ -113,7 +105,7 @@ class ProofOfVote:
 
         # If not timed out, check if all required votes received
         if total_votes >= required_votes:
-            approve_percentage = len(self.votes['approve']) / total_votes
+            approve_percentage = self.approve_count / total_votes
             print(f"All votes received. Approve percentage: {
                   approve_percentage}")
             return approve_percentage >= self.vote_threshold
@@ -122,6 +114,27 @@ class ProofOfVote:
         print(f"Still waiting for {required_votes - total_votes} votes")
         return None
 
+    def add_vote(self, voter_address, vote_data):
+        """Record a vote for the current proposal"""
+        if voter_address in self.voters:
+            raise ValueError("Member has already voted")
+
+        action = vote_data['action']
+        if action == 'approve':
+            self.approve_count += 1
+        elif action == 'reject':
+            self.reject_count += 1
+        else:
+            raise ValueError(f"Invalid vote action: {action}")
+        self.voters.add(voter_address)
+
+    def reset_votes(self, required_votes=None):
+        """Clear votes for the next proposal"""
+        self.approve_count = 0
+        self.reject_count = 0
+        self.voters = set()
+        self.required_votes = required_votes
+
     def get_active_lenders(self):
         # Implementation of get_active_lenders method
         pass
@@ -131,6 +144,7 @@ class Consensus:
     def __init__(self):
         self.proof_of_vote = None
         self.current_block = None
+        self.pending_blocks = {}  # Proposed blocks keyed by block index
         self.blockchain = None  # Will be set during initialize
 
     def initialize(self, config):
@@ -147,8 +161,9 @@ class Consensus:
         if block['index'] != len(chain) + 1:
             return False
 
-        # Check if previous hash matches
-        if block['previous_hash'] != self.hash_block(chain[-1]):
+        # Check if previous hash matches; chain blocks carry their own hash
+        last_hash = chain[-1].get('hash') or self.hash_block(chain[-1])
+        if block['previous_hash'] != last_hash:
             return False
 
         # Check if consensus was reached
@@ -159,10 +174,9 @@ class Consensus:
 
     def hash_block(self, block):
         """
-        Create a SHA-256 hash of a block
+        Create a hash of a block
         """
-        block_string = json.dumps(block, sort_keys=True).encode()
-        return hashlib.sha256(block_string).hexdigest()
+        return hash_block(block)
 
     def add_vote(self, voter_address, vote_data):
         """
@@ -182,29 +196,52 @@ class Consensus:
         """
         self.proof_of_vote.reset_votes()
 
-    def propose_block(self, chain, pending_transactions, block_data, members):
-        """Propose a new block"""
+    def propose_block(self, chain, pending_transactions, block_data, voters):
+        """Propose a new block
+
+        voters is the frozenset of addresses allowed to vote on it; its
+        size is the number of votes the proposal needs
+        """
         # Create block
         block = {
             'index': len(chain) + 1,
             'timestamp': time(),
             'data': block_data,
             # Use '1' for genesis block
-            'previous_hash': self.hash_block(chain[-1]) if chain else '1',
+            'previous_hash': chain[-1]['hash'] if chain else '1',
             'status': 'pending'
         }
 
         # Initialize voting for this block
         if self.proof_of_vote:
-            self.proof_of_vote.reset_votes()
+            self.proof_of_vote.reset_votes(len(voters))
         self.current_block = block
+        self.pending_blocks[block['index']] = block
 
         return block
 
-    def vote_for_block(self, block_index, voter_address, members):
-        """Vote on a proposed block"""
-        if not self.current_block:
-            raise ValueError("No block currently proposed")
+    def get_pending_blocks(self):
+        """Get all blocks awaiting votes"""
+        return list(self.pending_blocks.values())
+
+    def remove_block(self, block):
+        """Stop tracking a block once it is no longer awaiting votes"""
+        self.pending_blocks.pop(block['index'], None)
+        if self.current_block is block:
+            self.current_block = None
+
+    def vote_for_block(self, block_index, voter_address, voters):
+        """Vote on a proposed block
+
+        voters is a frozenset of addresses permitted to vote, maintained
+        by the blockchain so each vote is a single set lookup
+        """
+        if voter_address not in voters:
+            raise ValueError("Only active lenders can vote")
+
+        block = self.pending_blocks.get(block_index)
+        if block is None:
+            raise ValueError(f"No block proposed with index: {block_index}")
 
         # Add vote if ProofOfVote is initialized
         if self.proof_of_vote:
@@ -212,11 +249,11 @@ class Consensus:
 
             # Check if consensus reached
             if self.proof_of_vote.check_consensus():
-                self.current_block['status'] = 'approved'
-                return self.current_block, True
+                block['status'] = 'approved'
+                return block, True
         else:
             # Auto-approve if ProofOfVote not initialized (for genesis block)
-            self.current_block['status'] = 'approved'
-            return self.current_block, True
+            block['status'] = 'approved'
+            return block, True
 
-        return self.current_block, False
+        return block, False
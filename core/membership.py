@@ -3,14 +3,35 @@ This file handles membership requests and voting.
 It defines the Membership class which manages membership requests and the list of members.
 """
 
+import heapq
+import logging
+import os
+import threading
 from typing import Dict, Any, List
-import time as timestamp  # Ensure this import is present
 from core.blockchain import Blockchain
 from eth_account import Account
 from .membership_voting import MembershipVoting
 import time
 from datetime import datetime
-from utilities.convert_to_ethereum_address import generate_ethereum_address, validate_ethereum_address
+from utilities.convert_to_ethereum_address import generate_ethereum_address, validate_ethereum_address_format
+from utils.timeconv import convert_to_seconds
+from utils.config_util import load_config
+
+logger = logging.getLogger(__name__)
+
+VOTE_LOCK_STRIPES = 16
+
+# Keys every entry of a batch vote must carry
+BATCH_VOTE_FIELDS = ('member_address', 'voter_address', 'vote')
+
+MEMBERSHIP_CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'membership_config.json')
+
+
+def _load_role_permissions():
+    """Each role's permissions from the membership config, as frozensets"""
+    config = load_config(MEMBERSHIP_CONFIG_PATH)
+    return {role: frozenset(permissions)
+            for role, permissions in config['permissions'].items()}
 
 
 class Membership:
@@ -22,13 +43,23 @@ class Membership:
         self.rejected_requests = []
         self.members = []
         self.request_timeout = 30  # 30 seconds timeout for pending requests
+        # (requested_at, address) of pending requests, oldest first. Entries
+        # for members decided before their deadline are skipped when popped
+        self._expiry_heap = []
+        self._expiry_cond = threading.Condition()
+        # member address -> addresses that voted on it. Kept beside the
+        # record because member records must stay JSON-serializable
+        self._member_voters = {}
+        # Votes on one member are serialized by the stripe its address
+        # hashes to, so votes on other members are not held up
+        self._vote_locks = [threading.Lock() for _ in range(VOTE_LOCK_STRIPES)]
+        # role -> frozenset of permission names, built once per config load
+        self._role_permissions = _load_role_permissions()
 
     def add_member(self, name, role):
         """Add a new member pending consensus"""
         try:
-            print(f"\nAdding new member in Membership class:")
-            print(f"Name: {name}")
-            print(f"Role: {role}")
+            logger.debug("Adding new member: name=%s role=%s", name, role)
 
             # Create member with pending status
             member = {
@@ -39,157 +70,134 @@ class Membership:
                 'timestamp': int(time.time())
             }
 
-            print(f"Generated address: {member['address']}")
+            logger.debug("Generated address: %s", member['address'])
 
             # Validate the generated address
-            if not validate_ethereum_address(member['address']):
+            if not validate_ethereum_address_format(member['address']):
                 raise ValueError(f"Invalid Ethereum address generated: {
                                  member['address']}")
 
             # Add to blockchain members list
             if self.blockchain and hasattr(self.blockchain, 'members'):
-                print("Adding member to blockchain members list")
-                self.blockchain.members.append(member)
+                self.blockchain.register_member(member)
+                self._schedule_expiry(member)
             else:
                 raise ValueError(
                     "Blockchain or members list not properly initialized")
 
-            print(f"Current blockchain members: {self.blockchain.members}")
-
+            logger.info("Added pending member %s (%s)", name, member['address'])
             return member
 
-        except Exception as e:
-            print(f"Error in Membership.add_member: {str(e)}")
-            import traceback
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Error in Membership.add_member")
             raise
 
     def approve_member(self, member_address, approver_address):
         """Cast a vote to approve a member"""
         try:
-            # Debug logging
-            print(f"\nApproving member:")
-            print(f"Member address: {member_address}")
-            print(f"Approver address: {approver_address}")
+            logger.debug("Approving member %s, approver %s",
+                         member_address, approver_address)
 
             # Verify approver is an active lender
             if not self.is_active_lender(approver_address):
                 raise ValueError("Only active lenders can vote")
 
-            # Get the pending member
-            members = self.get_members()
-            print(f"\nCurrent members: {members}")  # Debug log
-
-            pending_member = None
-            for member in members['pending']:
-                if member['address'] == member_address:
-                    pending_member = member
-                    break
-
-            if not pending_member:
-                raise ValueError(f"No pending request found for address: {
-                                 member_address}")
+            # Held so the decision cannot race a vote or the auto-reject
+            with self._vote_lock(member_address):
+                # Get the pending member
+                pending_member = self.get_pending_member(member_address)
+                if not pending_member:
+                    raise ValueError(f"No pending request found for address: {
+                                     member_address}")
 
-            # Calculate required votes (51% of active lenders)
-            active_lenders = [m for m in members['active']
-                              if m['role'] == 'lender']
-            required_votes = (len(active_lenders) // 2) + 1
+                # Calculate required votes (51% of active lenders)
+                required_votes = (self.blockchain.get_active_lender_count() // 2) + 1
 
-            # For now, with single vote approval
-            pending_member['status'] = 'active'
-            pending_member['approved_at'] = int(time.time())
+                # For now, with single vote approval
+                pending_member['status'] = 'active'
+                pending_member['approved_at'] = int(time.time())
 
-            # Update the member in blockchain
-            self.blockchain.update_member(pending_member)
+                # Update the member in blockchain
+                self.blockchain.update_member(pending_member)
+                self._member_voters.pop(member_address, None)
 
             return pending_member
 
-        except Exception as e:
-            import traceback
-            print(f"\nError in approve_member:")
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Error in approve_member")
             raise
 
+    def get_member(self, address):
+        """Get a member by address, or None if unknown"""
+        return self.blockchain.get_member(address)
+
+    def is_member(self, address):
+        """Check if address belongs to any member"""
+        return self.blockchain.get_member(address) is not None
+
     def is_active_lender(self, address):
         """Check if address belongs to an active lender"""
-        members = self.get_members()
-        # Debug logging
-        print(f"\nChecking active lender status:")
-        print(f"Address to check: {address}")
-        print(f"Active members: {members['active']}")
-
-        # Make sure we're working with the list of active members
-        active_members = members.get('active', [])
-        if not isinstance(active_members, list):
-            print(f"Warning: active_members is not a list: {
-                  type(active_members)}")
-            return False
-
-        # Check if the address belongs to an active lender
-        for member in active_members:
-            if isinstance(member, dict):  # Ensure we're working with a dictionary
-                if member.get('address') == address and member.get('role') == 'lender':
-                    print(f"Found active lender: {member.get('name')}")
-                    return True
+        # The blockchain keeps the active lender addresses as a set
+        if address in self.blockchain.get_voters():
+            return True
 
-        print("No matching active lender found")
+        logger.debug("No active lender found for address: %s", address)
         return False
 
     def is_pending_member(self, address):
         """Check if address belongs to a pending member"""
-        pending = self.get_pending_requests()
-        return any(m['address'] == address for m in pending)
+        return self.get_pending_member(address) is not None
 
     def get_pending_member(self, address):
         """Get a pending member by address"""
-        pending = self.get_pending_requests()
-        return next((m for m in pending if m['address'] == address), None)
+        member = self.blockchain.get_member(address)
+        if member is not None and member['status'] == 'pending':
+            return member
+        return None
 
     def reject_member(self, member_address, approver_address):
         """Reject a pending member"""
         try:
-            # Debug logging
-            print(f"\nRejecting member:")
-            print(f"Member address: {member_address}")
-            print(f"Approver address: {approver_address}")
+            logger.debug("Rejecting member %s, approver %s",
+                         member_address, approver_address)
 
             # Verify approver is an active lender
             if not self.is_active_lender(approver_address):
                 raise ValueError("Only active lenders can reject members")
 
-            # Get the pending member
-            members = self.get_members()
-            print(f"\nCurrent members: {members}")  # Debug log
-
-            pending_member = None
-            for member in members['pending']:
-                if member['address'] == member_address:
-                    pending_member = member
-                    break
+            # Held so the decision cannot race a vote or the auto-reject
+            with self._vote_lock(member_address):
+                # Get the pending member
+                pending_member = self.get_pending_member(member_address)
+                if not pending_member:
+                    raise ValueError(f"No pending request found for address: {
+                                     member_address}")
 
-            if not pending_member:
-                raise ValueError(f"No pending request found for address: {
-                                 member_address}")
+                # Update member status
+                pending_member['status'] = 'rejected'
+                pending_member['rejected_at'] = int(time.time())
+                pending_member['rejected_by'] = approver_address
 
-            # Update member status
-            pending_member['status'] = 'rejected'
-            pending_member['rejected_at'] = int(time.time())
-            pending_member['rejected_by'] = approver_address
-
-            # Update the member in blockchain
-            self.blockchain.update_member(pending_member)
+                # Update the member in blockchain
+                self.blockchain.update_member(pending_member)
+                self._member_voters.pop(member_address, None)
 
             return pending_member
 
-        except Exception as e:
-            import traceback
-            print(f"\nError in reject_member:")
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Error in reject_member")
             raise
 
-    def get_members(self):
-        """Get all members"""
-        return self.blockchain.get_members()
+    def get_members(self, status=None):
+        """Get all members grouped by status, or only the status group"""
+        return self.blockchain.get_members(status)
+
+    def has_permission(self, address, permission):
+        """Check if the active member at address holds permission by role"""
+        member = self.blockchain.get_member(address)
+        if member is None or member['status'] != 'active':
+            return False
+        return permission in self._role_permissions.get(member.get('role'), ())
 
     def get_pending_requests(self):
         """Get pending membership requests"""
@@ -203,54 +211,66 @@ class Membership:
         """Clear all members from the system"""
         return self.blockchain.clear_members()
 
+    def _schedule_expiry(self, member):
+        """Queue a pending member for auto-rejection and wake the monitor"""
+        with self._expiry_cond:
+            heapq.heappush(self._expiry_heap,
+                           (member['timestamp'], member['address']))
+            self._expiry_cond.notify()
+
+    def _wait_for_expiry(self, timeout_seconds):
+        """Block until the oldest queued request is due, then pop it"""
+        with self._expiry_cond:
+            while True:
+                if not self._expiry_heap:
+                    self._expiry_cond.wait()
+                    continue
+                delay = self._expiry_heap[0][0] + timeout_seconds - time.time()
+                if delay <= 0:
+                    return heapq.heappop(self._expiry_heap)
+                self._expiry_cond.wait(delay)
+
+    def _expire_request(self, requested_at, address):
+        """Auto-reject a timed-out request popped from the expiry heap.
+        Returns whether the member was rejected"""
+        # Held so a vote deciding the member cannot race the timeout
+        with self._vote_lock(address):
+            # Skip requests decided (or re-submitted) since being queued
+            member = self.blockchain.get_member(address)
+            if (member is None or member['status'] != 'pending'
+                    or member['timestamp'] != requested_at):
+                return False
+
+            current_time = int(time.time())
+            logger.info("Auto-rejecting %s after %d seconds",
+                        member['name'], current_time - requested_at)
+            member['status'] = 'rejected'
+            member['rejected_at'] = current_time
+            member['rejected_by'] = 'auto-reject'
+            member['rejection_reason'] = 'timeout'
+            self.blockchain.update_member(member)
+            self._member_voters.pop(address, None)
+            return True
+
     def monitor_pending_requests(self):
         """Monitor pending requests and auto-reject if they timeout"""
-        while True:
-            try:
-                if not self.blockchain or not self.blockchain.config:
-                    print("Waiting for blockchain and config initialization...")
-                    time.sleep(5)
-                    continue
+        while not self.blockchain or not self.blockchain.config:
+            logger.debug("Waiting for blockchain and config initialization")
+            time.sleep(5)
 
-                members = self.blockchain.members  # Get members directly
-                current_time = int(time.time())
-
-                # Get timeout in seconds from auto_reject config
-                timeout_minutes = self.blockchain.config['auto_reject']['timeout']['value']
-                timeout_seconds = timeout_minutes * 60  # Convert minutes to seconds
-
-                # Debug logging
-                print("\nChecking pending members...")
-                print(f"Current time: {current_time}")
-                print(f"Timeout: {timeout_seconds} seconds")
-                print(f"Total members: {len(members)}")
-
-                # Check each member
-                for member in members:
-                    if member['status'] == 'pending':
-                        request_age = current_time - member['timestamp']
-
-                        # Debug logging
-                        print(f"\nChecking pending member: {member['name']}")
-                        print(f"Request age: {request_age} seconds")
-                        print(f"Member timestamp: {member['timestamp']}")
-
-                        # Auto-reject if request has timed out
-                        if request_age > timeout_seconds:
-                            print(
-                                f"\nAuto-rejecting {member['name']} due to timeout")
-                            member['status'] = 'rejected'
-                            member['rejected_at'] = current_time
-                            member['rejected_by'] = 'auto-reject'
-                            member['rejection_reason'] = 'timeout'
-
-                # Sleep for 10 seconds before next check
-                time.sleep(10)
+        # Get timeout in seconds from auto_reject config
+        timeout = self.blockchain.config['auto_reject']['timeout']
+        timeout_seconds = convert_to_seconds(timeout['value'], timeout['unit'])
 
-            except Exception as e:
-                print(f"Error in monitor_pending_requests: {str(e)}")
-                import traceback
-                print(traceback.format_exc())
+        # Requests that were already pending, e.g. from a synced chain
+        for member in self.blockchain.get_pending_members():
+            self._schedule_expiry(member)
+
+        while True:
+            try:
+                self._expire_request(*self._wait_for_expiry(timeout_seconds))
+            except Exception:
+                logger.exception("Error in monitor_pending_requests")
                 time.sleep(5)
 
     def check_pending_members(self):
@@ -258,92 +278,150 @@ class Membership:
         try:
             current_time = int(time.time())
 
-            # Get members by status
-            pending_members = [
-                m for m in self.blockchain.members if m['status'] == 'pending']
-            active_members = [
-                m for m in self.blockchain.members if m['status'] == 'active']
-            rejected_members = [
-                m for m in self.blockchain.members if m['status'] == 'rejected']
-
-            # Print member statistics
-            print("\nMember Statistics:")
-            print(f"Active members: {len(active_members)} ({
-                  [m['name'] for m in active_members]})")
-            print(f"Pending members: {len(pending_members)} ({
-                  [m['name'] for m in pending_members]})")
-            print(f"Rejected members: {len(rejected_members)} ({
-                  [m['name'] for m in rejected_members]})")
-
-            # Check for auto-rejection if there are pending members
+            # Member statistics, read from the blockchain's status index
+            if logger.isEnabledFor(logging.DEBUG):
+                counts = self.blockchain.get_member_counts()
+                logger.debug("Members: %d active, %d pending, %d rejected",
+                             counts['active'], counts['pending'],
+                             counts['rejected'])
+
+            # Check for auto-rejection; only pending members are visited
+            pending_members = self.blockchain.get_pending_members()
             if pending_members:
-                print("\nChecking pending members for auto-rejection...")
-                print(f"Current time: {current_time}")
-                print(
-                    f"Auto-reject timeout: {self.auto_reject_timeout} seconds")
 
                 for member in pending_members:
                     elapsed_time = current_time - member['timestamp']
                     if elapsed_time > self.auto_reject_timeout:
                         self.auto_reject_member(member)
 
-        except Exception as e:
-            print(f"Error checking pending members: {str(e)}")
+        except Exception:
+            logger.exception("Error checking pending members")
             raise
 
-    def vote_for_member(self, member_address, voter_address, vote_type):
-        """Process a vote for a member"""
-        try:
-            # Find target member
-            target_member = None
-            for member in self.blockchain.members:
-                if member['address'] == member_address:
-                    target_member = member
-                    break
-
-            if not target_member:
-                raise Exception('Member not found')
-
-            if target_member['status'] != 'pending':
-                raise Exception('Member is not in pending status')
-
-            # Initialize votes if not present
-            if 'votes' not in target_member:
-                target_member['votes'] = {'approve': [], 'reject': []}
-
-            # Check if already voted
-            if voter_address in target_member['votes']['approve'] or voter_address in target_member['votes']['reject']:
-                raise Exception('Already voted')
-
-            # Add vote
-            target_member['votes'][vote_type].append(voter_address)
-
-            # Count active lenders
-            active_lenders = [m for m in self.blockchain.members
-                              if m['status'] == 'active' and m['role'] == 'lender']
-            required_votes = len(active_lenders)
-
-            # Check if enough votes
-            if len(target_member['votes'][vote_type]) >= required_votes:
-                target_member['status'] = 'active' if vote_type == 'approve' else 'rejected'
-                target_member['approved_at'] = int(timestamp.time())
-                target_member['approved_by'] = ','.join(
-                    target_member['votes'][vote_type])
-                print(f"Member {target_member['name']} approved with {
-                      len(target_member['votes']['approve'])} votes")
-
-                # Add transaction to pending pool
-                self.blockchain.add_transaction({
-                    'type': 'member_approved' if vote_type == 'approve' else 'member_rejected',
-                    'member': target_member,
-                    'timestamp': int(timestamp.time())
-                })
-                return True
-            else:
-                print(f"Member {target_member['name']} has {
-                      len(target_member['votes'][vote_type])} of {required_votes} required votes")
-                return False
+    def _vote_lock(self, member_address):
+        """Lock guarding votes on and the decision for one member"""
+        return self._vote_locks[hash(member_address) % VOTE_LOCK_STRIPES]
+
+    def vote_for_member(self, member_address, voter_address, vote_type,
+                        required_votes=None):
+        """Process a vote for a member
 
-        except Exception as e:
-            print(f"Error in vote_for_member: {str(e)}")
+        required_votes defaults to the current number of active lenders
+        """
+        try:
+            with self._vote_lock(member_address):
+                # Find target member
+                target_member = self.blockchain.get_member(member_address)
+                if not target_member:
+                    raise Exception('Member not found')
+
+                if target_member['status'] != 'pending':
+                    raise Exception('Member is not in pending status')
+
+                # Initialize votes if not present
+                if 'votes' not in target_member:
+                    target_member['votes'] = {'approve': [], 'reject': []}
+
+                voters = self._member_voters.get(member_address)
+                if voters is None:
+                    voters = self._member_voters[member_address] = set(
+                        target_member['votes']['approve'] + target_member['votes']['reject'])
+
+                # Check if already voted
+                if voter_address in voters:
+                    raise Exception('Already voted')
+
+                if vote_type not in target_member['votes']:
+                    raise Exception(f'Invalid vote type: {vote_type}')
+
+                # Only active lenders count towards the threshold, and the
+                # early settlement below assumes every vote is one of theirs
+                if voter_address not in self.blockchain.get_voters():
+                    raise ValueError("Only active lenders can vote")
+
+                # Add vote; the lists keep the voting order for the ledger
+                target_member['votes'][vote_type].append(voter_address)
+                voters.add(voter_address)
+
+                # Every active lender has to vote
+                lender_count = self.blockchain.get_active_lender_count()
+                if required_votes is None:
+                    required_votes = lender_count
+
+                approvals = len(target_member['votes']['approve'])
+                rejections = len(target_member['votes']['reject'])
+                remaining = max(0, lender_count - approvals - rejections)
+
+                # Decide as soon as the outcome is settled. A request that
+                # can no longer reach the approvals it needs ends rejected
+                # either way, by votes or by timeout, so it is rejected now.
+                # With no votes required, the vote itself decides.
+                if required_votes <= 0:
+                    decision = vote_type
+                elif approvals >= required_votes:
+                    decision = 'approve'
+                elif (rejections >= required_votes
+                      or approvals + remaining < required_votes):
+                    decision = 'reject'
+                else:
+                    decision = None
+
+                if decision:
+                    now = int(time.time())
+                    target_member['status'] = 'active' if decision == 'approve' else 'rejected'
+                    target_member['approved_at'] = now
+                    target_member['approved_by'] = ','.join(
+                        target_member['votes'][decision])
+                    self.blockchain.update_member(target_member)
+                    self._member_voters.pop(member_address, None)
+                    logger.info("Member %s %s with %d votes", target_member['name'],
+                                target_member['status'],
+                                len(target_member['votes'][decision]))
+
+                    # Add transaction to pending pool
+                    self.blockchain.add_transaction({
+                        'type': 'member_approved' if decision == 'approve' else 'member_rejected',
+                        'member': target_member,
+                        'timestamp': now
+                    })
+                    return True
+                else:
+                    # Record the vote so the member listing reflects it
+                    self.blockchain.update_member(target_member)
+                    logger.debug("Member %s has %d of %d required votes",
+                                 target_member['name'],
+                                 len(target_member['votes'][vote_type]),
+                                 required_votes)
+                    return False
+
+        except Exception:
+            logger.exception("Error in vote_for_member")
             raise
+
+    def vote_for_members_batch(self, votes):
+        """Process several member votes against one count of active lenders
+
+        Each vote is a dict with member_address, voter_address and vote.
+        Returns a result per vote, in order; a refused vote reports its
+        error instead of aborting the rest of the batch
+        """
+        required_votes = self.blockchain.get_active_lender_count()
+        results = []
+        for vote in votes:
+            result = {'member_address': None}
+            try:
+                if not isinstance(vote, dict):
+                    raise ValueError('Vote must be an object')
+                result['member_address'] = vote.get('member_address')
+                missing = [field for field in BATCH_VOTE_FIELDS
+                           if field not in vote]
+                if missing:
+                    raise ValueError(f"Missing {', '.join(missing)}")
+
+                result['success'] = self.vote_for_member(
+                    vote['member_address'], vote['voter_address'],
+                    vote['vote'], required_votes)
+            except Exception as e:
+                result['error'] = str(e)
+            results.append(result)
+        return results
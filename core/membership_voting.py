@@ -19,26 +19,31 @@ class MembershipVoting:
             if not self.validate_vote(voter_data):
                 raise ValueError("Invalid vote data")
 
-            if member_address not in self.member_votes:
-                self.member_votes[member_address] = {
+            record = self.member_votes.get(member_address)
+            if record is None:
+                record = self.member_votes[member_address] = {
                     'votes': {},
+                    'approve_count': 0,
+                    'reject_count': 0,
                     'required_votes': (len(active_members) // 2) + 1
                 }
 
             voter_address = voter_data['voter_address']
-            if voter_address in self.member_votes[member_address]['votes']:
+            if voter_address in record['votes']:
                 raise ValueError("Member has already voted")
 
-            self.member_votes[member_address]['votes'][voter_address] = voter_data['vote']
-
-            vote_count = len([v for v in self.member_votes[member_address]['votes'].values()
-                              if v == 'approve'])
+            vote = voter_data['vote']
+            record['votes'][voter_address] = vote
+            if vote == 'approve':
+                record['approve_count'] += 1
+            else:
+                record['reject_count'] += 1
 
             return {
                 'member_address': member_address,
-                'votes_received': vote_count,
-                'required_votes': self.member_votes[member_address]['required_votes'],
-                'has_passed': vote_count >= self.member_votes[member_address]['required_votes']
+                'votes_received': record['approve_count'],
+                'required_votes': record['required_votes'],
+                'has_passed': record['approve_count'] >= record['required_votes']
             }
 
         except Exception as e:
@@ -64,8 +69,7 @@ class MembershipVoting:
             raise ValueError("No votes found for this member")
 
         votes = self.member_votes[member_address]
-        approve_count = len(
-            [v for v in votes['votes'].values() if v == 'approve'])
+        approve_count = votes['approve_count']
 
         return {
             'total_votes': len(votes['votes']),
@@ -6,9 +6,12 @@ It defines endpoints for creating new transactions, retrieving the blockchain, a
 import logging
 import argparse
 import socket
-import json
+import orjson
 import requests
-from flask import Flask, jsonify, request
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Flask, Response, jsonify, request
+from werkzeug.exceptions import HTTPException
 from uuid import uuid4
 from core.blockchain import Blockchain
 from core.membership import Membership
@@ -16,43 +19,94 @@ from use_case.api import create_api
 from utilities.convert_to_ethereum_address import generate_ethereum_address, validate_ethereum_address
 import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import time as timestamp
 import sys
 from utils.crypto_utils import CryptoUtils
+from utils.timeconv import convert_to_seconds
+from utils.config_util import load_config
+from utils.json_provider import OrjsonProvider
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Load network configuration
-with open('core/network_config.json', 'r') as config_file:
-    network_config = json.load(config_file)
+NETWORK_CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'network_config.json')
+network_config = load_config(NETWORK_CONFIG_PATH)
+
+# Shared HTTP session so calls to the main node reuse pooled connections
+_session = requests.Session()
+_session.mount('http://', HTTPAdapter(
+    pool_connections=16, pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.1)))
+
+# address -> expiry of a recent positive main node membership check.
+# Refusals are not cached, so a member approved meanwhile is let in at once
+_authorization_cache = {}
+AUTHORIZATION_TTL = 30  # seconds
+
+# Bounds of the block creation thread's retry delay after errors, in seconds
+ERROR_BACKOFF_MIN = 0.1
+ERROR_BACKOFF_MAX = 30.0
 
 
 def is_port_in_use(port):
     """Check if a port is already in use"""
+    # Trying to bind is a single local syscall, unlike connecting to a
+    # listener. SO_REUSEADDR is left unset: on BSD and macOS it lets the
+    # bind succeed beside a live listener.
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        return s.connect_ex(('localhost', port)) == 0
+        try:
+            s.bind(('localhost', port))
+        except OSError:
+            return True
+        return False
 
 
 def verify_member_authorization(address):
     """Verify if the member is authorized to connect to the network"""
     if not validate_ethereum_address(address):
         return False
+
+    # Keyed on the exact spelling, which is what the main node looks up
+    now = timestamp.monotonic()
+    expiry = _authorization_cache.get(address)
+    if expiry is not None and expiry > now:
+        return True
+
     try:
         main_port = network_config['main_node']['port']
-        endpoint = network_config['endpoints']['membership']
-        response = requests.get(f'http://localhost:{main_port}{endpoint}')
+        endpoint = network_config['endpoints']['member_exists']
+        response = _session.get(
+            f'http://localhost:{main_port}{endpoint}/{address}')
         if response.status_code == 200:
-            members = response.json().get('members', [])
-            return any(member['address'] == address for member in members)
+            authorized = bool(orjson.loads(response.content).get('exists'))
+            if authorized:
+                _authorization_cache[address] = now + AUTHORIZATION_TTL
+            return authorized
     except requests.exceptions.RequestException:
         return False
     return False
 
 
+def _payload_too_large(error):
+    return jsonify({'error': 'Payload too large'}), 413
+
+
+def _new_flask_app():
+    """Flask app with the settings shared by every node app"""
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    # Oversized bodies are refused from Content-Length before any of them
+    # is read or parsed
+    app.config['MAX_CONTENT_LENGTH'] = network_config['network']['max_content_length']
+    app.register_error_handler(413, _payload_too_large)
+    return app
+
+
 def create_app(blockchain=None, membership=None):
     """Create and configure the Flask application"""
-    app = Flask(__name__)
+    app = _new_flask_app()
 
     # Import api creation here to avoid circular import
     from use_case.api import create_api
@@ -66,7 +120,7 @@ def create_app(blockchain=None, membership=None):
 
 class Network:
     def __init__(self, port, is_main_node=True, main_node_port=5000, member_name=None):
-        self.app = Flask(__name__)
+        self.app = _new_flask_app()
         self.port = port
         self.is_main_node = is_main_node
         self.main_node_port = main_node_port
@@ -80,13 +134,13 @@ class Network:
         self.membership = None
 
         if self.is_main_node:
-            print("Initializing as main node...")
+            logger.info("Initializing as main node...")
             # Create new blockchain only if main node
             self.blockchain = Blockchain(self.config)
             self.membership = Membership(self.blockchain)
             self.initialize_main_node()
         else:
-            print("Initializing as member node...")
+            logger.info("Initializing as member node...")
             # For member nodes, sync first before any blockchain operations
             self.sync_with_main_node()
             if not self.blockchain:
@@ -103,8 +157,7 @@ class Network:
         """Load first member configuration"""
         config_path = os.path.join(os.path.dirname(
             __file__), '..', 'use_case', 'config', 'first_member_creation.config')
-        with open(config_path, 'r') as f:
-            self.first_member_config = json.load(f)
+        self.first_member_config = load_config(config_path)
 
     def initialize_main_node(self):
         """Initialize the main node with the first member"""
@@ -123,7 +176,7 @@ class Network:
                     'address': member_address,
                     'public_key': public_key,
                     'status': 'active',
-                    'created_at': int(timestamp.time())
+                    'created_at': timestamp.time_ns() // 1_000_000_000
                 }
 
                 # Store private key securely (in this example, we'll print it)
@@ -132,80 +185,73 @@ class Network:
                 print(private_key)
 
                 # Add to blockchain members
-                self.blockchain.members.append(member)
+                self.blockchain.register_member(member)
 
                 # Create a transaction for the first member
                 self.blockchain.add_transaction({
                     'type': 'member_created',
                     'member': member,
-                    'timestamp': int(timestamp.time())
+                    'timestamp': timestamp.time_ns() // 1_000_000_000
                 })
 
-                print(f"\nInitialized main node with first member: {
-                      member['name']} ({member['address']})")
+                logger.info("Initialized main node with first member: %s (%s)",
+                            member['name'], member['address'])
 
-        except Exception as e:
-            print(f"Error initializing main node: {str(e)}")
+        except Exception:
+            logger.exception("Error initializing main node")
             raise
 
     def sync_with_main_node(self):
         """Sync blockchain state with main node"""
         try:
-            print("Starting synchronization with main node...")
-
-            # Get chain from main node
-            response = requests.get(
-                f'http://localhost:{self.main_node_port}/chain')
-            if response.status_code == 200:
-                chain_data = response.json()
-
-                # Initialize blockchain with existing chain
-                self.blockchain = Blockchain(
-                    self.config, existing_chain=chain_data['chain'])
-                self.membership = Membership(self.blockchain)
-
-                print(f"Successfully synced blockchain with main node. Chain length: {
-                      len(self.blockchain.chain)}")
-            else:
-                raise Exception(f"Failed to sync blockchain. Status code: {
-                                response.status_code}")
-
-            # Get members from main node
-            response = requests.get(
-                f'http://localhost:{self.main_node_port}/membership/list')
-            if response.status_code == 200:
-                members_data = response.json()
-                if isinstance(members_data, dict) and 'members' in members_data:
-                    self.blockchain.members = members_data['members']
+            logger.info("Starting synchronization with main node...")
+
+            # The chain and member list are independent, so both requests
+            # are in flight at once and startup waits for the slower one
+            main_node = f'http://localhost:{self.main_node_port}'
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                chain_future = pool.submit(_session.get, f'{main_node}/chain')
+                members_future = pool.submit(
+                    _session.get, f'{main_node}/membership/list')
+
+                # Get chain from main node
+                response = chain_future.result()
+                if response.status_code == 200:
+                    chain_data = orjson.loads(response.content)
+
+                    # Initialize blockchain with existing chain
+                    self.blockchain = Blockchain(
+                        self.config, existing_chain=chain_data['chain'])
+                    self.membership = Membership(self.blockchain)
+
+                    logger.info("Successfully synced blockchain with main node. Chain length: %d",
+                                len(self.blockchain.chain))
                 else:
-                    self.blockchain.members = members_data if isinstance(
-                        members_data, list) else []
-                print(f"Successfully synced members with main node. Member count: {
-                      len(self.blockchain.members)}")
-            else:
-                raise Exception(f"Failed to sync members. Status code: {
-                                response.status_code}")
-
-        except Exception as e:
-            print(f"Error syncing with main node: {str(e)}")
+                    raise Exception(f"Failed to sync blockchain. Status code: {
+                                    response.status_code}")
+
+                # Get members from main node
+                response = members_future.result()
+                if response.status_code == 200:
+                    members_data = orjson.loads(response.content)
+                    if isinstance(members_data, dict) and 'members' in members_data:
+                        self.blockchain.set_members(members_data['members'])
+                    else:
+                        self.blockchain.set_members(members_data if isinstance(
+                            members_data, list) else [])
+                    logger.info("Successfully synced members with main node. Member count: %d",
+                                len(self.blockchain.members))
+                else:
+                    raise Exception(f"Failed to sync members. Status code: {
+                                    response.status_code}")
+
+        except Exception:
+            logger.exception("Error syncing with main node")
             sys.exit(1)
 
     def load_config(self):
         """Load network configuration"""
-        config_path = os.path.join(
-            os.path.dirname(__file__), 'network_config.json')
-        with open(config_path, 'r') as f:
-            self.config = json.load(f)
-
-    def convert_to_seconds(self, value, unit):
-        """Convert time units to seconds"""
-        units = {
-            'seconds': 1,
-            'minutes': 60,
-            'hours': 3600,
-            'days': 86400
-        }
-        return value * units.get(unit.lower(), 1)
+        self.config = load_config(NETWORK_CONFIG_PATH)
 
     def start_monitoring(self):
         """Start the monitoring thread for pending requests"""
@@ -214,189 +260,213 @@ class Network:
             daemon=True  # Make thread daemon so it exits when main thread exits
         )
         monitor_thread.start()
-        print("Started monitoring thread for pending requests")
+        logger.info("Started monitoring thread for pending requests")
 
     def register_routes(self):
         """Register all API endpoints"""
+        routes = [
+            # Chain endpoint
+            ('/chain', 'GET', self._get_chain),
+            # Member management endpoints
+            ('/membership/add', 'POST', self._add_member),
+            ('/membership/list', 'GET', self._get_members),
+            ('/membership/exists/<address>', 'GET', self._member_exists),
+            ('/membership/approve/<address>', 'POST', self._approve_member),
+            ('/membership/reject/<address>', 'POST', self._reject_member),
+            ('/membership/vote/batch', 'POST', self._vote_members_batch),
+            # Proposal endpoints
+            ('/proposals/submit', 'POST', self._submit_proposal),
+            ('/proposals/approve', 'POST', self._approve_proposal),
+            ('/proposals/reject', 'POST', self._reject_proposal),
+            ('/proposals/list', 'GET', self._get_proposals),
+        ]
+        for rule, method, view in routes:
+            self.app.add_url_rule(rule, view_func=view, methods=[method])
+
+        # One error path for every handler instead of a try/except each
+        self.app.register_error_handler(Exception, self._handle_error)
+
+    def _handle_error(self, error):
+        """Report errors in the JSON error envelope"""
+        if isinstance(error, HTTPException):
+            # Redirects such as a missing trailing slash are not errors
+            if error.code is None or error.code < 400:
+                return error
+            return jsonify({'error': error.description}), error.code
+        if isinstance(error, ValueError):
+            # Rejected input, e.g. a bad address; nothing to trace
+            logger.info("Bad request to %s %s: %s",
+                        request.method, request.path, error)
+            return jsonify({'error': str(error)}), 400
+        logger.exception("Error in %s %s", request.method, request.path)
+        return jsonify({'error': str(error)}), 500
+
+    def _get_chain(self):
+        # Streamed in batches of already encoded blocks rather than joined
+        # into one body
+        chunks, etag = self.blockchain.iter_chain_json()
+        response = Response(chunks, mimetype='application/json')
+        response.set_etag(etag)
+        return response.make_conditional(request)
+
+    def _add_member(self):
+        data = request.get_json()
+        if not data or 'name' not in data or 'role' not in data:
+            return jsonify({'error': 'Missing name or role'}), 400
+
+        member = self.membership.add_member(data['name'], data['role'])
+
+        # Add transaction to pending pool
+        self.blockchain.add_transaction({
+            'type': 'member_added',
+            'member': member,
+            'timestamp': member['timestamp']
+        })
+
+        return jsonify(member)
+
+    def _get_members(self):
+        # Same flat list either way; ?status= narrows it to one status
+        status = request.args.get('status')
+        if status:
+            return jsonify(self.blockchain.get_members_by_status(status))
+
+        body, etag = self.blockchain.get_members_json()
+        response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        return response.make_conditional(request)
+
+    def _member_exists(self, address):
+        return jsonify({'exists': self.blockchain.get_member(address) is not None})
+
+    def _approve_member(self, address):
+        data = request.get_json()
+        approver_address = data.get('approver_address')
+        if not approver_address:
+            return jsonify({'error': 'Missing approver_address'}), 400
+
+        result = self.membership.vote_for_member(
+            address, approver_address, 'approve')
+        return jsonify({'success': result})
+
+    def _reject_member(self, address):
+        data = request.get_json()
+        rejecter_address = data.get('approver_address')
+        if not rejecter_address:
+            return jsonify({'error': 'Missing approver_address'}), 400
+
+        result = self.membership.vote_for_member(
+            address, rejecter_address, 'reject')
+        return jsonify({'success': result})
+
+    def _vote_members_batch(self):
+        data = request.get_json()
+        if not data or not isinstance(data.get('votes'), list):
+            return jsonify({'error': 'Missing votes list'}), 400
+
+        results = self.membership.vote_for_members_batch(data['votes'])
+        return jsonify({'results': results})
+
+    def _submit_proposal(self):
+        data = request.get_json()
+        if not data or 'proposer_address' not in data or 'proposal_data' not in data:
+            return jsonify({'error': 'Missing proposer_address or proposal_data'}), 400
+
+        proposal = self.blockchain.consensus.submit_proposal(
+            data['proposer_address'],
+            data['proposal_data']
+        )
 
-        # Chain endpoint
-        @self.app.route('/chain', methods=['GET'])
-        def get_chain():
-            try:
-                chain_data = {
-                    'chain': self.blockchain.chain,
-                    'length': len(self.blockchain.chain)
-                }
-                return jsonify(chain_data)
-            except Exception as e:
-                print(f"Error getting chain: {str(e)}")
-                return jsonify({'error': str(e)}), 500
-
-        # Member management endpoints
-        @self.app.route('/membership/add', methods=['POST'])
-        def add_member():
-            try:
-                data = request.get_json()
-                if not data or 'name' not in data or 'role' not in data:
-                    return jsonify({'error': 'Missing name or role'}), 400
-
-                member = self.membership.add_member(data['name'], data['role'])
-
-                # Add transaction to pending pool
-                self.blockchain.add_transaction({
-                    'type': 'member_added',
-                    'member': member,
-                    'timestamp': int(timestamp.time())
-                })
+        # Add transaction to pending pool
+        self.blockchain.add_transaction({
+            'type': 'proposal_submitted',
+            'proposal': proposal,
+            'timestamp': timestamp.time_ns() // 1_000_000_000
+        })
 
-                return jsonify(member)
-            except Exception as e:
-                print(f"Error in add_member route: {str(e)}")
-                return jsonify({'error': str(e)}), 500
-
-        @self.app.route('/membership/list', methods=['GET'])
-        def get_members():
-            try:
-                return jsonify(self.blockchain.members)
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
-
-        @self.app.route('/membership/approve/<address>', methods=['POST'])
-        def approve_member(address):
-            try:
-                data = request.get_json()
-                approver_address = data.get('approver_address')
-                if not approver_address:
-                    return jsonify({'error': 'Missing approver_address'}), 400
-
-                result = self.membership.vote_for_member(
-                    address, approver_address, 'approve')
-                return jsonify({'success': result})
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
-
-        @self.app.route('/membership/reject/<address>', methods=['POST'])
-        def reject_member(address):
-            try:
-                data = request.get_json()
-                rejecter_address = data.get('approver_address')
-                if not rejecter_address:
-                    return jsonify({'error': 'Missing approver_address'}), 400
-
-                result = self.membership.vote_for_member(
-                    address, rejecter_address, 'reject')
-                return jsonify({'success': result})
-            except Exception as e:
-                return jsonify({'error': str(e)}), 500
-
-        # Proposal endpoints
-        @self.app.route('/proposals/submit', methods=['POST'])
-        def submit_proposal():
-            try:
-                data = request.get_json()
-                if not data or 'proposer_address' not in data or 'proposal_data' not in data:
-                    return jsonify({'error': 'Missing proposer_address or proposal_data'}), 400
-
-                proposal = self.blockchain.consensus.submit_proposal(
-                    data['proposer_address'],
-                    data['proposal_data']
-                )
-
-                # Add transaction to pending pool
-                self.blockchain.add_transaction({
-                    'type': 'proposal_submitted',
-                    'proposal': proposal,
-                    'timestamp': int(timestamp.time())
-                })
+        return jsonify(proposal)
 
-                return jsonify(proposal)
-            except Exception as e:
-                print(f"Error submitting proposal: {str(e)}")
-                return jsonify({'error': str(e)}), 500
-
-        @self.app.route('/proposals/approve', methods=['POST'])
-        def approve_proposal():
-            try:
-                data = request.get_json()
-                if not data or 'voter_address' not in data:
-                    return jsonify({'error': 'Missing voter_address'}), 400
-
-                result = self.blockchain.consensus.vote_proposal(
-                    data['voter_address'], 'approve')
-
-                if result:
-                    # Add transaction to pending pool
-                    self.blockchain.add_transaction({
-                        'type': 'proposal_approved',
-                        'voter': data['voter_address'],
-                        'timestamp': int(timestamp.time())
-                    })
-
-                return jsonify({'success': result})
-            except Exception as e:
-                print(f"Error approving proposal: {str(e)}")
-                return jsonify({'error': str(e)}), 500
-
-        @self.app.route('/proposals/reject', methods=['POST'])
-        def reject_proposal():
-            try:
-                data = request.get_json()
-                if not data or 'voter_address' not in data:
-                    return jsonify({'error': 'Missing voter_address'}), 400
-
-                result = self.blockchain.consensus.vote_proposal(
-                    data['voter_address'], 'reject')
-
-                if result:
-                    # Add transaction to pending pool
-                    self.blockchain.add_transaction({
-                        'type': 'proposal_rejected',
-                        'voter': data['voter_address'],
-                        'timestamp': int(timestamp.time())
-                    })
-
-                return jsonify({'success': result})
-            except Exception as e:
-                print(f"Error rejecting proposal: {str(e)}")
-                return jsonify({'error': str(e)}), 500
-
-        @self.app.route('/proposals/list', methods=['GET'])
-        def get_proposals():
-            try:
-                return jsonify({
-                    'current_proposal': self.blockchain.consensus.current_proposal,
-                    'votes': self.blockchain.consensus.votes
-                })
-            except Exception as e:
-                print(f"Error getting proposals: {str(e)}")
-                return jsonify({'error': str(e)}), 500
+    def _approve_proposal(self):
+        return self._vote_proposal('approve', 'proposal_approved')
+
+    def _reject_proposal(self):
+        return self._vote_proposal('reject', 'proposal_rejected')
+
+    def _vote_proposal(self, vote_type, transaction_type):
+        """Shared body of the proposal approve and reject endpoints"""
+        data = request.get_json()
+        if not data or 'voter_address' not in data:
+            return jsonify({'error': 'Missing voter_address'}), 400
+
+        result = self.blockchain.consensus.vote_proposal(
+            data['voter_address'], vote_type)
+
+        if result:
+            # Add transaction to pending pool
+            self.blockchain.add_transaction({
+                'type': transaction_type,
+                'voter': data['voter_address'],
+                'timestamp': timestamp.time_ns() // 1_000_000_000
+            })
+
+        return jsonify({'success': result})
+
+    def _get_proposals(self):
+        return jsonify({
+            'current_proposal': self.blockchain.consensus.current_proposal,
+            'votes': self.blockchain.consensus.votes
+        })
 
     def start_block_creation_thread(self):
         """Start thread for periodic block creation"""
         def create_blocks():
             check_freq_value = self.config['blockchain']['block_creation']['check_frequency']['value']
             check_freq_unit = self.config['blockchain']['block_creation']['check_frequency']['unit']
-            check_interval = self.convert_to_seconds(
+            check_interval = convert_to_seconds(
                 check_freq_value, check_freq_unit)
 
+            # Retry delay after a failed iteration, doubled on each failure
+            # in a row so a persistent fault is not retried in a tight loop
+            error_backoff = ERROR_BACKOFF_MIN
+
+            # The blockchain is set up before this thread starts and is not
+            # replaced afterwards, so its methods are looked up once
+            blockchain = self.blockchain
+            create_block = blockchain.create_block
+            add_block = blockchain.add_block
+            pending = blockchain.pending_transactions
+            transaction_event = blockchain.transaction_event
+
             while True:
                 try:
-                    block = self.blockchain.create_block()
+                    # Cleared before checking the pool so a transaction
+                    # pooled meanwhile still wakes the wait below
+                    transaction_event.clear()
+                    block = create_block()
                     if block:
-                        self.blockchain.add_block(block)
-                        print(f"\nNew block created with {
-                              len(block['transactions'])} transactions")
-                        print(f"Block: {block}")
-                    # Use timestamp instead of time
-                    timestamp.sleep(check_interval)
-                except Exception as e:
-                    print(f"Error in block creation: {str(e)}")
-                    timestamp.sleep(5)  # Wait 5 seconds on error
+                        add_block(block)
+                        logger.info("New block created with %d transactions",
+                                    len(block['transactions']))
+                        # Blocks can be large; skip formatting them unless
+                        # debug output is on
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("Block: %s", block)
+                    error_backoff = ERROR_BACKOFF_MIN
+
+                    # Sleep until a transaction arrives; while some are
+                    # waiting on the block interval, re-check periodically
+                    transaction_event.wait(check_interval if pending else None)
+                except Exception:
+                    logger.exception("Error in block creation, retrying in %.1fs",
+                                     error_backoff)
+                    timestamp.sleep(error_backoff)
+                    error_backoff = min(error_backoff * 2, ERROR_BACKOFF_MAX)
 
         block_thread = threading.Thread(target=create_blocks, daemon=True)
         block_thread.start()
-        print(f"\nStarted block creation thread with interval: {self.config['blockchain']['block_creation']['interval']['value']} {
-              self.config['blockchain']['block_creation']['interval']['unit']}")
+        interval = self.config['blockchain']['block_creation']['interval']
+        logger.info("Started block creation thread with interval: %s %s",
+                    interval['value'], interval['unit'])
 
 
 if __name__ == '__main__':
@@ -420,7 +490,7 @@ if __name__ == '__main__':
 
     try:
         app = create_app(args.port, args.address)
-        logger.info(f'Starting blockchain node on port {args.port}')
+        logger.info('Starting blockchain node on port %d', args.port)
         app.run(
             host=network_config['main_node']['host'],
             port=args.port
@@ -1,5 +1,6 @@
 import argparse
 import json
+import logging
 import os
 import requests
 import sys
@@ -65,6 +66,14 @@ def main():
         # Load network configuration
         network_config = load_network_config()
 
+        # Configure logging before the node starts, so block and membership
+        # messages from the core modules are shown
+        logging.basicConfig(
+            level=getattr(logging, network_config['logging']['level']),
+            format=network_config['logging']['format'],
+            datefmt=network_config['logging']['date_format']
+        )
+
         # Check if main node exists and get chain info
         main_node_exists = is_main_node_running(network_config)
 
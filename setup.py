@@ -9,8 +9,8 @@ setup(
     version='0.1',
     packages=find_packages(),
     install_requires=[
-        'Flask==2.0.1',
-        'Werkzeug==2.0.3',
+        'Flask>=2.2',
+        'orjson>=3.10',
     ],
     entry_points={
         'console_scripts': [
@@ -28,5 +28,5 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.12',
 )
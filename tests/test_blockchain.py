@@ -0,0 +1,61 @@
+"""
+Blockchain tests
+
+Covers the pending transaction pool and the blocks made from it.
+"""
+
+from decimal import Decimal
+
+import orjson
+import pytest
+
+from core.blockchain import Blockchain
+from core.network import NETWORK_CONFIG_PATH
+from utils.config_util import load_config
+from utils.hashing_util import hash_block
+
+
+@pytest.fixture
+def blockchain():
+    chain = Blockchain(load_config(NETWORK_CONFIG_PATH))
+    # No waiting on the block interval
+    chain.block_interval = 0
+    return chain
+
+
+def test_add_transaction_accepts_payload_that_is_not_plain_json(blockchain):
+    blockchain.add_transaction({
+        'type': 'funding',
+        'amount': Decimal('10.50'),
+        'shares': {1: 'alice', 2: 'bob'},
+    })
+
+    pooled = blockchain.pending_transactions[0]['data']
+    assert pooled['amount'] == '10.50'
+    assert pooled['shares'] == {'1': 'alice', '2': 'bob'}
+
+    block = blockchain.create_block()
+    assert block['hash'] == hash_block(block)
+
+
+def test_add_transaction_rejects_unencodable_payload(blockchain):
+    with pytest.raises(TypeError):
+        blockchain.add_transaction({'type': 'bad', 'value': object()})
+    assert not blockchain.pending_transactions
+
+
+def test_chain_stream_stops_at_its_snapshot(blockchain):
+    for _ in range(3):
+        blockchain.add_block({'index': len(blockchain.chain) + 1,
+                              'hash': f'{len(blockchain.chain):064x}'})
+
+    chunks, etag = blockchain.iter_chain_json(batch_size=3)
+    assert etag == f"4-{blockchain.chain[3]['hash']}"
+
+    # Another request extends the shared cache before this one is sent
+    blockchain.add_block({'index': 5, 'hash': 'ff' * 32})
+    blockchain.iter_chain_json()
+
+    body = orjson.loads(b''.join(chunks))
+    assert body['length'] == 4
+    assert len(body['chain']) == 4
@@ -0,0 +1,50 @@
+"""
+Block hashing tests
+
+Checks that a block's hash commits to its transactions, whatever digest
+is stored on the block.
+"""
+
+import copy
+
+from utils.hashing_util import hash_block, transactions_digest
+
+
+def make_block():
+    transactions = [
+        {'type': 'member_created', 'member': {'name': 'Alice'}, 'timestamp': 1},
+        {'type': 'member_added', 'member': {'name': 'Bob'}, 'timestamp': 2},
+    ]
+    return {
+        'index': 2,
+        'timestamp': 1700000000,
+        'transactions': transactions,
+        'transactions_hash': transactions_digest(transactions),
+        'previous_hash': 'ab' * 32,
+    }
+
+
+def test_hash_changes_when_transaction_is_edited():
+    block = make_block()
+    original = hash_block(block)
+
+    tampered = copy.deepcopy(block)
+    tampered['transactions'][1]['member']['name'] = 'Mallory'
+
+    # The stored digest is left alone, as a forger would leave it
+    assert tampered['transactions_hash'] == block['transactions_hash']
+    assert hash_block(tampered) != original
+
+
+def test_stored_digest_is_not_trusted():
+    block = make_block()
+    original = hash_block(block)
+
+    block['transactions_hash'] = '00' * 32
+    assert hash_block(block) == original
+
+
+def test_passed_digest_matches_recomputed_hash():
+    block = make_block()
+    digest = transactions_digest(block['transactions'])
+    assert hash_block(block, digest) == hash_block(block)
@@ -0,0 +1,128 @@
+"""
+Membership tests
+
+Covers member voting and the auto-reject of timed-out requests, on a
+blockchain built in memory with no node threads running.
+"""
+
+import pytest
+
+from core.blockchain import Blockchain
+from core.membership import Membership
+from core.network import NETWORK_CONFIG_PATH
+from utils.config_util import load_config
+
+
+@pytest.fixture
+def membership():
+    blockchain = Blockchain(load_config(NETWORK_CONFIG_PATH))
+    return Membership(blockchain)
+
+
+def add_lender(membership, name):
+    """Register an active lender directly, as the main node's first member"""
+    member = {
+        'address': '0x' + bytes([len(membership.blockchain.members) + 1] * 20).hex(),
+        'name': name,
+        'role': 'lender',
+        'status': 'active',
+        'timestamp': 0,
+    }
+    membership.blockchain.register_member(member)
+    return member['address']
+
+
+def test_single_reject_settles_when_approval_must_be_unanimous(membership):
+    alice = add_lender(membership, 'Alice')
+    add_lender(membership, 'Bob')
+    carol = membership.add_member('Carol', 'borrower')
+
+    # Both lenders must approve; once one rejects, approval is impossible
+    assert membership.vote_for_member(carol['address'], alice, 'reject') is True
+
+    assert membership.get_member(carol['address'])['status'] == 'rejected'
+    assert carol['address'] not in membership._member_voters
+
+
+def test_vote_short_of_quorum_leaves_member_pending(membership):
+    alice = add_lender(membership, 'Alice')
+    bob = add_lender(membership, 'Bob')
+    carol = membership.add_member('Carol', 'borrower')
+
+    assert membership.vote_for_member(carol['address'], alice, 'approve') is False
+    assert membership.get_member(carol['address'])['status'] == 'pending'
+
+    assert membership.vote_for_member(carol['address'], bob, 'approve') is True
+    assert membership.get_member(carol['address'])['status'] == 'active'
+
+
+def test_duplicate_vote_is_refused(membership):
+    alice = add_lender(membership, 'Alice')
+    add_lender(membership, 'Bob')
+    carol = membership.add_member('Carol', 'borrower')
+
+    membership.vote_for_member(carol['address'], alice, 'approve')
+    with pytest.raises(Exception, match='Already voted'):
+        membership.vote_for_member(carol['address'], alice, 'reject')
+
+
+def expire_due(membership):
+    """Pop every queued request as if its timeout had passed"""
+    results = []
+    while membership._expiry_heap:
+        results.append(membership._expire_request(*membership._wait_for_expiry(0)))
+    return results
+
+
+def test_expiry_rejects_request_still_pending(membership):
+    dave = membership.add_member('Dave', 'borrower')
+
+    assert expire_due(membership) == [True]
+    member = membership.get_member(dave['address'])
+    assert member['status'] == 'rejected'
+    assert member['rejected_by'] == 'auto-reject'
+
+
+def test_expiry_skips_member_decided_before_timeout(membership):
+    alice = add_lender(membership, 'Alice')
+    dave = membership.add_member('Dave', 'borrower')
+    membership.vote_for_member(dave['address'], alice, 'approve')
+
+    assert expire_due(membership) == [False]
+    assert membership.get_member(dave['address'])['status'] == 'active'
+
+
+def test_expiry_skips_entry_of_resubmitted_request(membership):
+    dave = membership.add_member('Dave', 'borrower')
+    stale_entry = (dave['timestamp'], dave['address'])
+
+    # Re-submitted: same address, new request time
+    member = membership.get_member(dave['address'])
+    member['timestamp'] -= 60
+    membership.blockchain.update_member(member)
+
+    # The entry queued for the first request no longer matches
+    assert membership._expire_request(*stale_entry) is False
+    assert membership.get_member(dave['address'])['status'] == 'pending'
+
+
+def test_vote_from_non_lender_is_refused(membership):
+    add_lender(membership, 'Alice')
+    add_lender(membership, 'Bob')
+    carol = membership.add_member('Carol', 'borrower')
+
+    with pytest.raises(ValueError, match='Only active lenders'):
+        membership.vote_for_member(carol['address'], '0x' + 'ee' * 20, 'reject')
+
+    member = membership.get_member(carol['address'])
+    assert member['status'] == 'pending'
+    assert member['votes']['reject'] == []
+
+
+def test_reject_with_no_votes_required_rejects(membership):
+    alice = add_lender(membership, 'Alice')
+    carol = membership.add_member('Carol', 'borrower')
+
+    assert membership.vote_for_member(
+        carol['address'], alice, 'reject', required_votes=0) is True
+    assert membership.get_member(carol['address'])['status'] == 'rejected'
@@ -0,0 +1,169 @@
+"""
+Network API tests
+
+Exercises the routes of a main node's Flask app through its test client,
+without starting a server.
+"""
+
+import pytest
+
+from core import network
+from core.network import Network
+
+
+@pytest.fixture
+def node():
+    return Network(port=5999, is_main_node=True, member_name='Alice')
+
+
+@pytest.fixture
+def client(node):
+    return node.app.test_client()
+
+
+def test_member_list_status_filter_keeps_shape(client):
+    response = client.post('/membership/add', json={'name': 'Bob', 'role': 'lender'})
+    assert response.status_code == 200
+    bob = response.get_json()
+
+    everyone = client.get('/membership/list').get_json()
+    pending = client.get('/membership/list?status=pending').get_json()
+    active = client.get('/membership/list?status=active').get_json()
+
+    assert isinstance(everyone, list)
+    assert isinstance(pending, list)
+    assert isinstance(active, list)
+    assert [m['address'] for m in pending] == [bob['address']]
+    assert [m['name'] for m in active] == ['Alice']
+    assert len(everyone) == 2
+
+
+def test_grouped_members_keep_shape_when_filtered(node):
+    node.membership.add_member('Bob', 'lender')
+
+    grouped = node.membership.get_members()
+    pending = node.membership.get_members('pending')
+
+    assert pending.keys() == grouped.keys()
+    assert pending['active'] == [] and pending['rejected'] == []
+    assert [m['name'] for m in pending['pending']] == ['Bob']
+    assert pending['total_count'] == {'active': 0, 'pending': 1, 'rejected': 0}
+
+
+def test_malformed_json_gets_json_error(client):
+    response = client.post('/membership/add', data=b'{not json',
+                           content_type='application/json')
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
+
+
+def test_unknown_route_gets_json_error(client):
+    response = client.get('/no/such/route')
+    assert response.status_code == 404
+    assert 'error' in response.get_json()
+
+
+def test_value_error_is_a_bad_request(node, client, monkeypatch):
+    def refuse(name, role):
+        raise ValueError('Invalid role')
+    monkeypatch.setattr(node.membership, 'add_member', refuse)
+
+    response = client.post('/membership/add', json={'name': 'Eve', 'role': 'x'})
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Invalid role'}
+
+
+def test_refused_authorization_is_not_cached(monkeypatch):
+    answers = iter([False, True])
+
+    class Reply:
+        status_code = 200
+
+        def __init__(self, exists):
+            self.content = b'{"exists": true}' if exists else b'{"exists": false}'
+
+    monkeypatch.setattr(network._session, 'get', lambda url: Reply(next(answers)))
+    monkeypatch.setattr(network, '_authorization_cache', {})
+
+    address = '0x' + 'ab' * 20
+    assert network.verify_member_authorization(address) is False
+    # Approved since the first check; the refusal must not be served again
+    assert network.verify_member_authorization(address) is True
+
+
+def test_is_port_in_use_sees_a_listener():
+    import socket
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as listener:
+        listener.bind(('localhost', 0))
+        listener.listen()
+        port = listener.getsockname()[1]
+        assert network.is_port_in_use(port)
+
+
+def test_chain_is_streamed_with_etag(node, client):
+    response = client.get('/chain')
+    assert response.status_code == 200
+    assert response.is_streamed
+
+    body = response.get_json()
+    assert body['length'] == len(node.blockchain.chain) == len(body['chain'])
+    assert body['chain'][-1]['hash'] == node.blockchain.chain[-1]['hash']
+
+    etag = response.headers['ETag']
+    assert client.get('/chain', headers={'If-None-Match': etag}).status_code == 304
+
+    # A new block changes the ETag, so the old one no longer matches
+    node.blockchain.add_block({'index': len(node.blockchain.chain) + 1,
+                               'hash': 'ee' * 32})
+    response = client.get('/chain', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json()['length'] == len(node.blockchain.chain)
+
+
+def test_authorization_cache_is_keyed_on_exact_spelling(monkeypatch):
+    asked = []
+
+    class Reply:
+        status_code = 200
+        content = b'{"exists": true}'
+
+    def get(url):
+        asked.append(url)
+        return Reply()
+
+    monkeypatch.setattr(network._session, 'get', get)
+    monkeypatch.setattr(network, '_authorization_cache', {})
+
+    address = '0x' + 'aB' * 20
+    assert network.verify_member_authorization(address) is True
+    assert network.verify_member_authorization(address) is True
+    assert len(asked) == 1
+
+    # Another spelling is checked with the main node, not served from cache
+    network.verify_member_authorization(address.lower())
+    assert len(asked) == 2 and asked[1].endswith(address.lower())
+
+
+def test_batch_vote_reports_each_entry(node, client):
+    alice = node.blockchain.members[0]['address']
+    bob = client.post('/membership/add', json={'name': 'Bob', 'role': 'lender'}).get_json()
+
+    response = client.post('/membership/vote/batch', json={'votes': [
+        'x',
+        {'member_address': bob['address'], 'vote': 'approve'},
+        {'member_address': bob['address'], 'voter_address': alice, 'vote': 'approve'},
+    ]})
+    assert response.status_code == 200
+
+    results = response.get_json()['results']
+    assert results[0] == {'member_address': None, 'error': 'Vote must be an object'}
+    assert results[1] == {'member_address': bob['address'],
+                          'error': 'Missing voter_address'}
+    assert results[2] == {'member_address': bob['address'], 'success': True}
+    assert node.blockchain.get_member(bob['address'])['status'] == 'active'
+
+
+def test_batch_vote_needs_a_votes_list(client):
+    response = client.post('/membership/vote/batch', json={'votes': 'x'})
+    assert response.status_code == 400
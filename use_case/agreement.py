@@ -1,4 +1,4 @@
-from datetime import datetime
+import time
 from uuid import uuid4
 
 
@@ -19,7 +19,7 @@ class Agreement:
                 agreement_data['agreement_id'] = str(uuid4())
                 agreement_data['proposal_id'] = proposal_id
                 agreement_data['status'] = 'pending_signatures'
-                agreement_data['created_at'] = datetime.utcnow().isoformat()
+                agreement_data['created_at'] = int(time.time())
                 return {'status': 'success', 'agreement': agreement_data}, 201
         except ValueError as e:
             return {'status': 'error', 'message': str(e)}, 400
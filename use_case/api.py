@@ -33,9 +33,9 @@ def create_api(membership):
 
     @api.route('/membership/list', methods=['GET'])
     def list_members():
-        """List all members"""
+        """List all members by status; ?status= fills only that group"""
         try:
-            members = membership.get_members()
+            members = membership.get_members(request.args.get('status'))
             return jsonify(members), 200
         except Exception as e:
             return jsonify({
@@ -1,4 +1,4 @@
-from datetime import datetime
+import time
 from decimal import Decimal
 from uuid import uuid4
 
@@ -18,7 +18,7 @@ class Funding:
             if self.validate_funding(funding_data):
                 funding_data['funding_id'] = str(uuid4())
                 funding_data['proposal_id'] = proposal_id
-                funding_data['timestamp'] = datetime.utcnow().isoformat()
+                funding_data['timestamp'] = int(time.time())
                 return {'status': 'success', 'funding': funding_data}, 201
         except ValueError as e:
             return {'status': 'error', 'message': str(e)}, 400
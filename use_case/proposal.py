@@ -2,14 +2,13 @@ from decimal import Decimal
 from uuid import uuid4
 from datetime import datetime
 import re
-import json
+from utils.config_util import load_config
 
 
 class Proposal:
     def __init__(self):
         # Load configuration
-        with open('use_case/proposal_config.json', 'r') as config_file:
-            self.config = json.load(config_file)
+        self.config = load_config('use_case/proposal_config.json')
 
         self.required_fields = {
             'title': str,                  # Title of the project
@@ -1,4 +1,4 @@
-from datetime import datetime
+import time
 from uuid import uuid4
 
 
@@ -19,7 +19,7 @@ class ReviewProcess:
             if self.validate_review(review_data):
                 review_data['review_id'] = str(uuid4())
                 review_data['proposal_id'] = proposal_id
-                review_data['timestamp'] = datetime.utcnow().isoformat()
+                review_data['timestamp'] = int(time.time())
                 return {'status': 'success', 'review': review_data}, 201
         except ValueError as e:
             return {'status': 'error', 'message': str(e)}, 400
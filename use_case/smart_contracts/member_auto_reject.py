@@ -1,4 +1,3 @@
-from datetime import datetime, timedelta
 from typing import Dict, Optional, List, Any, TYPE_CHECKING
 from enum import Enum
 
@@ -6,6 +5,7 @@ import json
 import threading
 import time
 from utilities.notification import send_reminder
+from utils.timeconv import convert_to_seconds
 
 if TYPE_CHECKING:
     from core.membership import Membership
@@ -42,6 +42,13 @@ class MemberAutoRejectContract:
         # Validate time units
         self._validate_time_units(self.config)
 
+        # Request timestamps are integer epoch seconds, so deadlines are
+        # plain integer offsets from them
+        self.timeout_seconds = convert_to_seconds(
+            self.config['timeout']['value'], self.config['timeout']['unit'])
+        self.reminder_seconds = convert_to_seconds(
+            self.config['reminder']['value'], self.config['reminder']['unit'])
+
         # Start monitoring thread only if auto-reject feature is enabled
         if self.config['enabled']:
             self._start_monitoring()
@@ -64,24 +71,6 @@ class MemberAutoRejectContract:
                 raise ValueError(f"Unsupported time unit '{
                                  unit}'. Must be one of: {valid_units}")
 
-    def _convert_to_timedelta(self, value: int, unit: str) -> timedelta:
-        """
-        Convert a time value and unit to a timedelta object.
-
-        Args:
-            value: Number of time units
-            unit: Unit of time ('minutes' or 'hours')
-
-        Returns:
-            timedelta object representing the specified time
-        """
-        if unit == TimeUnit.MINUTES.value:
-            return timedelta(minutes=value)
-        elif unit == TimeUnit.HOURS.value:
-            return timedelta(hours=value)
-        else:
-            raise ValueError(f"Unsupported time unit: {unit}")
-
     def _start_monitoring(self) -> None:
         """
         Start a daemon thread to monitor pending membership requests.
@@ -105,7 +94,7 @@ class MemberAutoRejectContract:
                     print("Auto-reject disabled, stopping monitoring thread")
                     break
 
-                current_time = datetime.utcnow()
+                current_time = int(time.time())
                 pending_requests = self.membership.get_pending_requests()
 
                 # Only log if there are pending requests
@@ -114,25 +103,12 @@ class MemberAutoRejectContract:
                                       } pending requests at {current_time}")
 
                 for request in pending_requests:
-                    # Convert Unix timestamp to string for fromisoformat
-                    request_time_str = datetime.fromtimestamp(
-                        request['timestamp']).isoformat()
-                    request_time = datetime.fromisoformat(request_time_str)
-
                     # Calculate timing thresholds
-                    auto_reject_time = request_time + self._convert_to_timedelta(
-                        self.config['timeout']['value'],
-                        self.config['timeout']['unit']
-                    )
-                    reminder_time = auto_reject_time - self._convert_to_timedelta(
-                        self.config['reminder']['value'],
-                        self.config['reminder']['unit']
-                    )
-
-                    time_to_reject = (auto_reject_time -
-                                      current_time).total_seconds()
-                    time_to_reminder = (
-                        reminder_time - current_time).total_seconds()
+                    auto_reject_time = request['timestamp'] + self.timeout_seconds
+                    reminder_time = auto_reject_time - self.reminder_seconds
+
+                    time_to_reject = auto_reject_time - current_time
+                    time_to_reminder = reminder_time - current_time
 
                     # Check if reminder should be sent
                     if time_to_reminder <= 0 and not request.get('reminder_sent'):
@@ -165,14 +141,9 @@ class MemberAutoRejectContract:
             print(f"Sending reminder for request {request['request_id']}")
 
             # Calculate time remaining until auto-reject
-            current_time = datetime.utcnow()
-            request_time = datetime.fromisoformat(request['timestamp'])
-            auto_reject_time = request_time + self._convert_to_timedelta(
-                self.config['timeout']['value'],
-                self.config['timeout']['unit']
-            )
-            time_remaining = (auto_reject_time -
-                              current_time).total_seconds() / 60
+            current_time = int(time.time())
+            auto_reject_time = request['timestamp'] + self.timeout_seconds
+            time_remaining = (auto_reject_time - current_time) / 60
 
             # Send reminder notification
             message = (
@@ -192,14 +163,14 @@ class MemberAutoRejectContract:
                     'type': 'membership_reminder',
                     'request_id': request['request_id'],
                     'message': message,
-                    'timestamp': current_time.isoformat(),
+                    'timestamp': current_time,
                     'time_remaining_minutes': time_remaining
                 }
             )
 
             # Mark reminder as sent in the request object
             request['reminder_sent'] = True
-            request['reminder_time'] = current_time.isoformat()
+            request['reminder_time'] = current_time
 
         except Exception as e:
             print(f"Error sending reminder: {str(e)}")
@@ -233,7 +204,7 @@ class MemberAutoRejectContract:
                     'type': 'membership_auto_rejected',
                     'request_id': request['request_id'],
                     'reason': 'Request timed out',
-                    'timestamp': datetime.utcnow().isoformat(),
+                    'timestamp': int(time.time()),
                     'auto_reject_enabled': True,
                     'auto_rejected_by': 'system'
                 }
@@ -270,19 +241,13 @@ class MemberAutoRejectContract:
                 'request_id': request_id
             }
 
-        current_time = datetime.utcnow()
-        request_time = datetime.fromisoformat(request['timestamp'])
-
-        auto_reject_time = request_time + self._convert_to_timedelta(
-            self.config['timeout']['value'],
-            self.config['timeout']['unit']
-        )
+        auto_reject_time = request['timestamp'] + self.timeout_seconds
 
         return {
             'request_id': request_id,
             'status': request.get('status', 'pending'),
             'auto_rejected': request.get('auto_rejected', False),
-            'time_remaining': (auto_reject_time - current_time).total_seconds(),
+            'time_remaining': auto_reject_time - int(time.time()),
             'auto_reject_enabled': self.config['enabled'],
-            'timeout_at': auto_reject_time.isoformat()
+            'timeout_at': auto_reject_time
         }
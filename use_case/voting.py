@@ -1,5 +1,4 @@
-from datetime import datetime
-from uuid import uuid4
+import time
 
 
 class Voting:
@@ -10,14 +9,19 @@ class Voting:
             'comments': str
         }
         self.allowed_votes = ['approve', 'reject', 'abstain']
+        # Votes cast so far per proposal; vote ids only need to be
+        # unique within their proposal
+        self.vote_sequence = {}
 
     def submit_vote(self, proposal_id, vote_data):
         """Submit a vote for a proposal"""
         try:
             if self.validate_vote(vote_data):
-                vote_data['vote_id'] = str(uuid4())
+                sequence = self.vote_sequence.get(proposal_id, 0) + 1
+                self.vote_sequence[proposal_id] = sequence
+                vote_data['vote_id'] = f"{proposal_id}:{sequence}"
                 vote_data['proposal_id'] = proposal_id
-                vote_data['timestamp'] = datetime.utcnow().isoformat()
+                vote_data['timestamp'] = int(time.time())
                 return {'status': 'success', 'vote': vote_data}, 201
         except ValueError as e:
             return {'status': 'error', 'message': str(e)}, 400
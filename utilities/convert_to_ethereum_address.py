@@ -1,21 +1,35 @@
+import os
+import re
+from functools import lru_cache
 from eth_utils import to_checksum_address
-from eth_account import Account
+
+# Shape of a hex address, without the EIP-55 checksum
+_ADDRESS_FORMAT = re.compile(r'0x[0-9a-fA-F]{40}')
 
 
 def generate_ethereum_address() -> str:
     """Generate a valid Ethereum address"""
-    # Generate a new Ethereum account
-    account = Account.create()
-    address = account.address
+    # The account's private key was never kept, so the address is only an
+    # identifier and random bytes serve as well as deriving it from a
+    # freshly generated key pair
+    return to_checksum_address(os.urandom(20))
 
-    # Convert to checksum address
-    checksum_address = to_checksum_address(address)
 
-    return checksum_address
+def validate_ethereum_address_format(address: str) -> bool:
+    """Check only that address is 0x followed by 40 hex digits"""
+    return isinstance(address, str) and _ADDRESS_FORMAT.fullmatch(address) is not None
 
 
 def validate_ethereum_address(address: str) -> bool:
     """Validate an Ethereum address"""
+    if not isinstance(address, str):
+        return False
+    return _validate_checksum_address(address)
+
+
+@lru_cache(maxsize=4096)
+def _validate_checksum_address(address: str) -> bool:
+    """Full validation, cached since member addresses recur constantly"""
     try:
         # Convert to checksum address and verify format
         to_checksum_address(address)
@@ -0,0 +1,20 @@
+import os
+from functools import lru_cache
+
+import orjson
+
+
+@lru_cache(maxsize=8)
+def _load_config(path, mtime):
+    """Parse a JSON config file; mtime is part of the cache key"""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def load_config(path):
+    """Load a JSON config file, reparsing only when it changes on disk
+
+    The parsed dict is shared between callers and must not be modified
+    """
+    path = os.path.abspath(path)
+    return _load_config(path, os.path.getmtime(path))
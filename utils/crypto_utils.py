@@ -1,7 +1,7 @@
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
 from cryptography.hazmat.backends import default_backend
-import json
+import orjson
 
 
 class CryptoUtils:
@@ -41,7 +41,7 @@ class CryptoUtils:
 
         # Convert message to bytes if it's not already
         if isinstance(message, dict):
-            message = json.dumps(message, sort_keys=True).encode()
+            message = orjson.dumps(message, option=orjson.OPT_SORT_KEYS)
         elif isinstance(message, str):
             message = message.encode()
 
@@ -69,7 +69,7 @@ class CryptoUtils:
 
             # Convert message to bytes if it's not already
             if isinstance(message, dict):
-                message = json.dumps(message, sort_keys=True).encode()
+                message = orjson.dumps(message, option=orjson.OPT_SORT_KEYS)
             elif isinstance(message, str):
                 message = message.encode()
 
@@ -1,8 +1,107 @@
 import hashlib
-import json
+import struct
+from decimal import Decimal
 
+import orjson
 
-def hash_block(block):
-    """Create a SHA-256 hash of a block"""
-    block_string = json.dumps(block, sort_keys=True).encode()
-    return hashlib.sha256(block_string).hexdigest()
+# Header fields are packed in this fixed order, followed by a digest of
+# the block's transactions; everything else in the block is appended as
+# sorted JSON. The block's own 'hash' is never part of its digest.
+_HEADER = struct.Struct('<QdH')  # index, timestamp, len(previous_hash)
+_HEADER_FIELDS = ('index', 'timestamp', 'previous_hash', 'hash',
+                  'transactions', 'transactions_hash')
+_TX_LENGTH = struct.Struct('<I')
+
+# Bound once so the per-block encode path skips the attribute lookups
+_dumps = orjson.dumps
+_SORT_KEYS = orjson.OPT_SORT_KEYS
+# Transactions may carry non-str dict keys, which are encoded as strings
+_TX_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def _hash_bytes(value):
+    """Raw digest bytes for a hex hash, UTF-8 for placeholders like '0'"""
+    try:
+        return bytes.fromhex(value)
+    except (TypeError, ValueError):
+        return str(value).encode()
+
+
+def _new_hasher(data=b''):
+    """Start a block digest: BLAKE2b truncated to 32 bytes, the width of
+    the old SHA-256 hashes. Every node must agree on it"""
+    return hashlib.blake2b(data, digest_size=32)
+
+
+def _encode_default(value):
+    """Canonical JSON stand-ins for values orjson does not encode"""
+    if isinstance(value, Decimal):
+        # As a string, so no precision is lost to a float
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if isinstance(value, bytes):
+        return value.hex()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def encode_transaction(transaction):
+    """Encode a transaction into canonical bytes"""
+    return _dumps(transaction, default=_encode_default, option=_TX_OPTIONS)
+
+
+def update_transactions_hash(hasher, encoded):
+    """Absorb one encoded transaction, length-prefixed so that a running
+    hash over several transactions stays unambiguous"""
+    hasher.update(_TX_LENGTH.pack(len(encoded)))
+    hasher.update(encoded)
+
+
+def new_transactions_hasher():
+    """Start a running hash over a block's transactions"""
+    return _new_hasher()
+
+
+def transactions_digest(transactions):
+    """Hash a list of transactions in one pass"""
+    hasher = new_transactions_hasher()
+    for transaction in transactions:
+        update_transactions_hash(hasher, encode_transaction(transaction))
+    return hasher.hexdigest()
+
+
+def _update_with_block(hasher, block, transactions_hash=None):
+    """Feed a block's canonical byte layout into a hasher piece by piece,
+    so no intermediate buffer is built for the whole encoding"""
+    previous_hash = _hash_bytes(block.get('previous_hash', ''))
+    body = {k: v for k, v in block.items() if k not in _HEADER_FIELDS}
+
+    hasher.update(_HEADER.pack(block.get('index', 0),
+                               block.get('timestamp', 0),
+                               len(previous_hash)))
+    hasher.update(previous_hash)
+
+    # The digest stored on a block is never trusted, otherwise a block's
+    # transactions could be edited without changing its hash. Only the
+    # creator, which built the digest from the transactions itself, may
+    # pass it in.
+    if 'transactions' in block:
+        if transactions_hash is None:
+            transactions_hash = transactions_digest(block['transactions'])
+        hasher.update(b'\x01')
+        hasher.update(bytes.fromhex(transactions_hash))
+    else:
+        hasher.update(b'\x00')
+
+    hasher.update(_dumps(body, option=_SORT_KEYS))
+
+
+def hash_block(block, transactions_hash=None):
+    """Create a hash of a block
+
+    transactions_hash is the digest of block['transactions'], for callers
+    that just computed it; otherwise the transactions are re-encoded
+    """
+    hasher = _new_hasher()
+    _update_with_block(hasher, block, transactions_hash)
+    return hasher.hexdigest()
@@ -0,0 +1,12 @@
+# Seconds per configurable time unit
+_UNITS = {
+    'seconds': 1,
+    'minutes': 60,
+    'hours': 3600,
+    'days': 86400
+}
+
+
+def convert_to_seconds(value, unit):
+    """Convert a config {value, unit} duration to seconds"""
+    return value * _UNITS.get(unit.lower(), 1)